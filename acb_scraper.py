@@ -16,14 +16,24 @@ OUTPUT FILES:
     - acb_boxscores_TIMESTAMP.json: Game-by-game box scores
 """
 
-import json
+import functools
 import os
 import re
-import requests
+import shutil
+import unicodedata
+from collections import defaultdict
+import orjson
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 import logging
+import threading
 import time
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -39,6 +49,10 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 ACB_BASE_URL = 'https://www.acb.com'
 SEASON_ID = '2025'  # ACB uses single year for season ID
+MAX_WORKERS = 8  # Concurrent page fetches (keeps load on acb.com bounded)
+REQUESTS_PER_SECOND = 4  # Sustained request rate across all workers
+MAX_JORNADAS = 34  # Regular season rounds
+EMPTY_JORNADA_LIMIT = 3  # Stop after this many consecutive jornadas with no new matches
 
 # Known American players from TheSportsDB (name variations for matching)
 KNOWN_AMERICAN_PLAYERS = [
@@ -74,32 +88,96 @@ ACB_TEAMS = {
     18: 'Rio Breogan',
 }
 
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+# Compiled once at import; these run for every roster, player and match page.
+PLAYER_HREF_RE = re.compile(r'/jugador/ver/(\d+)')
+PLAYER_LINK_RE = re.compile(r'/jugador/')
+MATCH_HREF_RE = re.compile(r'/partido/estadisticas/id/(\d+)')
+DATE_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+EURO_DATE_RE = re.compile(r'(\d{1,2})[/\-\.](\d{1,2})[/\-\.](\d{4})')
+
+# Player page fields
+HEIGHT_RE = re.compile(r'(\d[,\.]\d{2})\s*m')
+JERSEY_RE = re.compile(r'Dorsal[:\s]*(\d+)', re.IGNORECASE)
+GAMES_RE = re.compile(r'Partidos[:\s]*(\d+)', re.IGNORECASE)
+PPG_RE = re.compile(r'Puntos[^0-9]*(\d+[,\.]\d)', re.IGNORECASE)
+RPG_RE = re.compile(r'Rebotes[^0-9]*(\d+[,\.]\d)', re.IGNORECASE)
+APG_RE = re.compile(r'Asistencias[^0-9]*(\d+[,\.]\d)', re.IGNORECASE)
+# One alternation so the page is scanned once; groups are listed in priority order
+NATIONALITY_RE = re.compile(
+    r'(?P<usa>EE\.UU\.|\bUSA\b|Estados Unidos|United States)'
+    r'|(?P<esp>Espa[ñn]a|Spain)'
+    r'|(?P<fra>Francia|France)'
+    r'|(?P<srb>Serbia)'
+    r'|(?P<cro>Croacia|Croatia)'
+    r'|(?P<arg>Argentina)'
+    r'|(?P<ita>Italia|Italy)',
+    re.IGNORECASE,
+)
+NATIONALITY_PRIORITY = ('usa', 'esp', 'fra', 'srb', 'cro', 'arg', 'ita')
+
+# Positions as (label, lowercase label), checked in order
+POSITION_PATTERNS = [
+    (pos, pos.lower())
+    for pos in ['Base', 'Escolta', 'Alero', 'Ala-Pívot', 'Pívot', 'Guard', 'Forward', 'Center']
+]
+
+# CSS class matchers
+STATS_CLASS_RE = re.compile(r'stats|estadisticas')
+# Stats container on a player page, tried in order (the averages live in here)
+STATS_CONTAINER_SELECTORS = (
+    'div[class*="estadisticas"], div[class*="stats"]',
+    'table[class*="estadisticas"], table[class*="stats"]',
+)
+PLAYER_NAME_CLASS_RE = re.compile(r'nombre|name|titulo')
 
+# Parse filter: only build the game containers of a calendar page.
+# Strainers compare the raw class attribute, so match 'partido' as one of its words.
+MATCH_CONTAINERS_ONLY = SoupStrainer(['div', 'article'], class_=re.compile(r'(?:^|\s)partido(?:\s|$)'))
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name):
-    """Normalize player name for matching."""
+    """Normalize player name for matching (cached: names repeat across box scores)."""
     if not name:
         return ''
     # Remove accents and special chars, lowercase
-    import unicodedata
     name = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('ASCII')
     return name.lower().strip()
 
 
+# Normalized known American names, built once for is_known_american
+KNOWN_AMERICAN_NORMALIZED = [normalize_name(n) for n in KNOWN_AMERICAN_PLAYERS]
+KNOWN_AMERICAN_FULL_NAMES = set(KNOWN_AMERICAN_NORMALIZED)
+KNOWN_AMERICAN_LAST_NAMES = {
+    n.split()[-1] for n in KNOWN_AMERICAN_NORMALIZED
+    if n.split() and len(n.split()[-1]) > 3
+}
+# Partial matching in one pass each way: any known name inside the player's
+# name (one regex alternation), or the player's name inside any known name
+# (one substring search over the newline-joined list)
+KNOWN_AMERICAN_SUBSTRING_RE = re.compile('|'.join(re.escape(n) for n in KNOWN_AMERICAN_NORMALIZED if n))
+KNOWN_AMERICAN_BLOB = '\n'.join(KNOWN_AMERICAN_NORMALIZED)
+
+
+@functools.lru_cache(maxsize=4096)
 def is_known_american(name):
-    """Check if player name matches a known American player."""
+    """Check if player name matches a known American player (cached: called for every box-score row)."""
     name_norm = normalize_name(name)
-    for american in KNOWN_AMERICAN_PLAYERS:
-        american_norm = normalize_name(american)
-        # Check for partial matches
-        if american_norm in name_norm or name_norm in american_norm:
-            return True
-        # Check last name match
-        american_parts = american_norm.split()
-        name_parts = name_norm.split()
-        if american_parts and name_parts:
-            if american_parts[-1] == name_parts[-1] and len(american_parts[-1]) > 3:
-                return True
-    return False
+
+    # Exact full name or last name match
+    if name_norm in KNOWN_AMERICAN_FULL_NAMES:
+        return True
+    name_parts = name_norm.split()
+    if name_parts and name_parts[-1] in KNOWN_AMERICAN_LAST_NAMES:
+        return True
+
+    # Check for partial matches
+    if KNOWN_AMERICAN_SUBSTRING_RE.search(name_norm):
+        return True
+    return '\n' not in name_norm and name_norm in KNOWN_AMERICAN_BLOB
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -114,32 +192,132 @@ def save_json(data, filename):
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
 
     logger.info(f"Saved: {filepath}")
     return filepath
 
 
-def fetch_page(url, retries=3):
-    """Fetch a page with retry logic."""
-    for attempt in range(retries):
-        try:
-            if attempt > 0:
-                time.sleep(2 ** attempt)
+def stream_json_array(filename, header, array_key, items, count_key):
+    """
+    Save a JSON object whose `array_key` list is written item by item from an iterable,
+    so the full list is never held in memory. `count_key` is written after the list.
+    Returns (filepath, item count).
+    """
+    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, filename)
+    options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    count = 0
+    with open(filepath, 'wb') as f:
+        f.write(b'{\n')
+        for key, value in header.items():
+            f.write(b'  ' + orjson.dumps(key) + b': ' + orjson.dumps(value, option=options, default=str).replace(b'\n', b'\n  ') + b',\n')
+        f.write(b'  ' + orjson.dumps(array_key) + b': [')
+        for item in items:
+            f.write(b',\n    ' if count else b'\n    ')
+            f.write(orjson.dumps(item, option=options, default=str).replace(b'\n', b'\n    '))
+            count += 1
+        f.write(b'\n  ],\n' if count else b'],\n')
+        f.write(b'  ' + orjson.dumps(count_key) + b': ' + str(count).encode() + b'\n}')
 
-            resp = requests.get(url, headers=HEADERS, timeout=30)
-            resp.raise_for_status()
-            time.sleep(0.5)  # Rate limiting
-            return resp.text
+    logger.info(f"Saved: {filepath}")
+    return filepath, count
 
-        except Exception as e:
-            logger.warning(f"Attempt {attempt + 1}/{retries} failed for {url}: {e}")
-            if attempt == retries - 1:
-                logger.error(f"Failed to fetch {url}")
-                return None
 
-    return None
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+    Allows bursts of up to `burst` requests, refilled at `rate` requests per second.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1:
+                # Waiting inside the lock queues the other workers behind us
+                time.sleep((1 - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 0
+            else:
+                self.tokens -= 1
+
+
+RATE_LIMITER = RateLimiter(REQUESTS_PER_SECOND, burst=MAX_WORKERS)
+
+# On-disk HTTP cache. Completed box scores never change and rosters/player
+# pages change rarely, so re-runs only go to the network for calendar pages.
+CACHE_PATH = os.path.join(os.path.dirname(__file__), 'output', 'cache', 'acb_cache')
+CACHE_EXPIRY = {
+    '*/calendario/*': 3600,
+    '*/partido/estadisticas/*': requests_cache.NEVER_EXPIRE,
+    '*/club/plantilla/*': 86400,
+    '*/jugador/ver/*': 86400,
+}
+
+# Shared session: keep-alive connections to acb.com are reused across requests,
+# transient failures are retried with exponential backoff by urllib3, and
+# responses are cached per CACHE_EXPIRY (anything else is not cached).
+SESSION = requests_cache.CachedSession(
+    CACHE_PATH,
+    expire_after=requests_cache.DO_NOT_CACHE,
+    urls_expire_after=CACHE_EXPIRY,
+)
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+
+def fetch_page(url):
+    """Fetch a page using the shared session (retries are handled by the adapter)."""
+    try:
+        # Fresh cache hits don't touch acb.com, so they skip the rate limiter
+        resp = SESSION.get(url, timeout=30, only_if_cached=True)
+        if resp.status_code == 504:
+            RATE_LIMITER.acquire()
+            resp = SESSION.get(url, timeout=30)
+        resp.raise_for_status()
+        return resp.text
+
+    except Exception as e:
+        logger.error(f"Failed to fetch {url}: {e}")
+        return None
+
+
+def fetch_pages(urls):
+    """
+    Fetch several pages concurrently.
+    Returns list of HTML strings (or None on failure) in the same order as urls.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(fetch_page, urls))
+
+
+def find_links(html, href_fragment):
+    """
+    Return <a> elements whose href contains href_fragment, in document order.
+    Uses lxml directly - much cheaper than a BeautifulSoup tree when only links are needed.
+    """
+    try:
+        tree = lxml.html.fromstring(html)
+    except (ValueError, etree.ParserError):
+        return []
+    return tree.xpath('//a[contains(@href, $fragment)]', fragment=href_fragment)
 
 
 def fetch_team_roster(team_id):
@@ -153,15 +331,14 @@ def fetch_team_roster(team_id):
     if not html:
         return []
 
-    soup = BeautifulSoup(html, 'html.parser')
     players = []
     seen_ids = set()
 
     # Find player links
-    for player_link in soup.find_all('a', href=re.compile(r'/jugador/ver/\d+')):
+    for player_link in find_links(html, '/jugador/ver/'):
         try:
             href = player_link.get('href', '')
-            player_id_match = re.search(r'/jugador/ver/(\d+)', href)
+            player_id_match = PLAYER_HREF_RE.search(href)
             if not player_id_match:
                 continue
 
@@ -170,7 +347,7 @@ def fetch_team_roster(team_id):
                 continue
             seen_ids.add(player_id)
 
-            name = player_link.get_text(strip=True)
+            name = ''.join(text.strip() for text in player_link.itertext())
             if not name or len(name) < 2:
                 continue
 
@@ -186,85 +363,104 @@ def fetch_team_roster(team_id):
     return players
 
 
-def fetch_player_details(player_id):
+@functools.lru_cache(maxsize=4)
+def _player_page_soup(player_id):
     """
-    Fetch detailed player info from individual player page.
-    Returns dict with nationality, position, stats, etc.
+    Fetch and parse a player's season page, raising LookupError if it can't be
+    fetched. lru_cache doesn't memoize exceptions, so failures get retried.
     """
     url = f"{ACB_BASE_URL}/jugador/ver/{player_id}/temporada_id/{SEASON_ID}"
     html = fetch_page(url)
 
     if not html:
+        raise LookupError(url)
+
+    return BeautifulSoup(html, 'lxml')
+
+
+def fetch_player_page(player_id):
+    """
+    Fetch and parse a player's season page.
+    The last few soups are cached so fetch_player_details and fetch_player_stats
+    share one download; failed fetches are not cached.
+    Returns BeautifulSoup or None.
+    """
+    try:
+        return _player_page_soup(player_id)
+    except LookupError:
+        return None
+
+
+def fetch_player_details(player_id):
+    """
+    Fetch detailed player info from individual player page.
+    Returns dict with nationality, position, stats, etc.
+    """
+    soup = fetch_player_page(player_id)
+    if soup is None:
         return None
 
-    soup = BeautifulSoup(html, 'html.parser')
     details = {'acb_id': player_id}
 
     # Get full page text for parsing
     page_text = soup.get_text()
 
-    # Extract nationality - look for country patterns
-    nationality_patterns = [
-        r'EE\.UU\.|USA|Estados Unidos|United States',
-        r'Espa[ñn]a|Spain',
-        r'Francia|France',
-        r'Serbia',
-        r'Croacia|Croatia',
-        r'Argentina',
-        r'Italia|Italy',
-    ]
-
-    for pattern in nationality_patterns:
-        if re.search(pattern, page_text, re.IGNORECASE):
-            if 'EE.UU' in page_text or 'USA' in page_text or 'Estados Unidos' in page_text:
-                details['nationality'] = 'USA'
-                break
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                details['nationality'] = match.group(0)
-                break
+    # Extract nationality - first match per country, USA wins wherever it appears
+    found = {}
+    for match in NATIONALITY_RE.finditer(page_text):
+        found.setdefault(match.lastgroup, match.group(0))
+        if match.lastgroup == 'usa':
+            break
+
+    for country in NATIONALITY_PRIORITY:
+        if country in found:
+            details['nationality'] = 'USA' if country == 'usa' else found[country]
+            break
 
     # Look for specific data patterns
     # Height
-    height_match = re.search(r'(\d[,\.]\d{2})\s*m', page_text)
+    height_match = HEIGHT_RE.search(page_text)
     if height_match:
         details['height'] = height_match.group(1).replace(',', '.')
 
     # Jersey
-    jersey_match = re.search(r'Dorsal[:\s]*(\d+)', page_text, re.IGNORECASE)
+    jersey_match = JERSEY_RE.search(page_text)
     if jersey_match:
         details['jersey'] = jersey_match.group(1)
 
     # Position
-    position_patterns = ['Base', 'Escolta', 'Alero', 'Ala-Pívot', 'Pívot', 'Guard', 'Forward', 'Center']
-    for pos in position_patterns:
-        if pos.lower() in page_text.lower():
+    page_text_lower = page_text.lower()
+    for pos, pos_lower in POSITION_PATTERNS:
+        if pos_lower in page_text_lower:
             details['position'] = pos
             break
 
-    # Stats - look for statistics table
-    # Games, Points, Rebounds, Assists
-    games_match = re.search(r'Partidos[:\s]*(\d+)', page_text, re.IGNORECASE)
+    # Stats - restrict the stat regexes to the statistics container rather
+    # than rescanning the whole page for each one
+    stats_section = None
+    for selector in STATS_CONTAINER_SELECTORS:
+        stats_section = soup.select_one(selector)
+        if stats_section:
+            break
+    stats_text = stats_section.get_text() if stats_section else page_text
+
+    # Games
+    games_match = GAMES_RE.search(stats_text)
+    if not games_match and stats_section:
+        games_match = GAMES_RE.search(page_text)
     if games_match:
         details['games_played'] = int(games_match.group(1))
 
-    # Look for average stats (format: X.X or X,X)
-    stats_section = soup.find('div', class_=re.compile(r'stats|estadisticas'))
-    if stats_section:
-        stats_text = stats_section.get_text()
-    else:
-        stats_text = page_text
-
     # Extract PPG, RPG, APG from common patterns
-    ppg_match = re.search(r'Puntos[^0-9]*(\d+[,\.]\d)', stats_text, re.IGNORECASE)
+    ppg_match = PPG_RE.search(stats_text)
     if ppg_match:
         details['ppg'] = float(ppg_match.group(1).replace(',', '.'))
 
-    rpg_match = re.search(r'Rebotes[^0-9]*(\d+[,\.]\d)', stats_text, re.IGNORECASE)
+    rpg_match = RPG_RE.search(stats_text)
     if rpg_match:
         details['rpg'] = float(rpg_match.group(1).replace(',', '.'))
 
-    apg_match = re.search(r'Asistencias[^0-9]*(\d+[,\.]\d)', stats_text, re.IGNORECASE)
+    apg_match = APG_RE.search(stats_text)
     if apg_match:
         details['apg'] = float(apg_match.group(1).replace(',', '.'))
 
@@ -275,22 +471,19 @@ def fetch_player_stats(player_id):
     """
     Fetch season statistics for a player from ACB website.
     """
-    url = f"{ACB_BASE_URL}/jugador/ver/{player_id}/temporada_id/{SEASON_ID}"
-    html = fetch_page(url)
-
-    if not html:
+    soup = fetch_player_page(player_id)
+    if soup is None:
         return None
 
-    soup = BeautifulSoup(html, 'html.parser')
     stats = {'acb_id': player_id}
 
     # Extract player basic info
-    name_elem = soup.find(['h1', 'h2'], class_=re.compile(r'nombre|name|titulo'))
+    name_elem = soup.find(['h1', 'h2'], class_=PLAYER_NAME_CLASS_RE)
     if name_elem:
         stats['name'] = name_elem.get_text(strip=True)
 
     # Find stats table
-    stats_table = soup.find('table', class_=re.compile(r'estadisticas|stats'))
+    stats_table = soup.find('table', class_=STATS_CLASS_RE)
     if not stats_table:
         # Try finding any table with stats
         for table in soup.find_all('table'):
@@ -344,14 +537,26 @@ def parse_euro_date(date_str):
     if not date_str:
         return None
     # Handle various formats: DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY
-    import re
-    match = re.search(r'(\d{1,2})[/\-\.](\d{1,2})[/\-\.](\d{4})', date_str)
+    match = EURO_DATE_RE.search(date_str)
     if match:
         day, month, year = match.groups()
         return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
     return None
 
 
+def parse_number(text):
+    """
+    Convert a stat cell to int or float.
+    Integers are recognised without raising; returns None if not numeric.
+    """
+    if text.isdecimal() or (text[:1] in ('-', '+') and text[1:].isdecimal()):
+        return int(text)
+    try:
+        return float(text.replace(',', '.'))
+    except ValueError:
+        return None
+
+
 def fetch_box_score(match_id):
     """
     Fetch box score for a single game from ACB website.
@@ -362,7 +567,7 @@ def fetch_box_score(match_id):
     if not html:
         return None
 
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
     box_score = {
         'match_id': match_id,
         'players': [],
@@ -373,9 +578,8 @@ def fetch_box_score(match_id):
 
     # Extract date from page (format: DD/MM/YYYY)
     # Look for date in various places
-    date_pattern = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
     page_text = soup.get_text()
-    date_match = date_pattern.search(page_text)
+    date_match = DATE_RE.search(page_text)
     if date_match:
         box_score['date'] = parse_euro_date(date_match.group())
 
@@ -398,13 +602,15 @@ def fetch_box_score(match_id):
         col_map = {}
 
         for row in rows:
+            # Walk each row's cells once; both branches reuse these lists
             cells = row.find_all(['th', 'td'])
-            cell_texts = [c.get_text(strip=True).upper() for c in cells]
+            cell_texts = [c.get_text(strip=True) for c in cells]
+            cell_texts_upper = [t.upper() for t in cell_texts]
 
             # Check if this is a header row
-            if 'MIN' in cell_texts or 'PTS' in cell_texts:
+            if 'MIN' in cell_texts_upper or 'PTS' in cell_texts_upper:
                 header_row = row
-                for idx, text in enumerate(cell_texts):
+                for idx, text in enumerate(cell_texts_upper):
                     if text == 'MIN':
                         col_map['minutes'] = idx
                     elif text in ['PTS', 'PT', 'P']:
@@ -439,15 +645,14 @@ def fetch_box_score(match_id):
                 continue
 
             # Parse player row
-            cells = row.find_all(['td', 'th'])
             if len(cells) < 5:
                 continue
 
             # Find player name/link
-            player_link = row.find('a', href=re.compile(r'/jugador/'))
+            player_link = row.find('a', href=PLAYER_LINK_RE)
             if player_link:
                 href = player_link.get('href', '')
-                player_id_match = re.search(r'/jugador/ver/(\d+)', href)
+                player_id_match = PLAYER_HREF_RE.search(href)
                 player_name = player_link.get_text(strip=True)
 
                 if not player_name or 'total' in player_name.lower():
@@ -460,8 +665,8 @@ def fetch_box_score(match_id):
 
                 # Extract stats based on column map
                 for stat_name, col_idx in col_map.items():
-                    if col_idx < len(cells):
-                        cell_text = cells[col_idx].get_text(strip=True)
+                    if col_idx < len(cell_texts):
+                        cell_text = cell_texts[col_idx]
                         # Handle time format MM:SS
                         if stat_name == 'minutes' and ':' in cell_text:
                             player_stats['minutes'] = cell_text
@@ -487,13 +692,9 @@ def fetch_box_score(match_id):
                                 except:
                                     pass
                         else:
-                            try:
-                                player_stats[stat_name] = int(cell_text)
-                            except:
-                                try:
-                                    player_stats[stat_name] = float(cell_text.replace(',', '.'))
-                                except:
-                                    pass
+                            value = parse_number(cell_text)
+                            if value is not None:
+                                player_stats[stat_name] = value
 
                 box_score['players'].append(player_stats)
 
@@ -506,91 +707,124 @@ def fetch_season_matches():
     Returns list of match details including teams, dates, scores.
     """
     matches = []
+    seen_match_ids = set()
+    empty_streak = 0
+
+    # Fetch calendar pages a batch at a time (concurrently), then parse in order.
+    # Once EMPTY_JORNADA_LIMIT downloaded jornadas in a row add nothing (e.g. preseason, or
+    # the rest of the season isn't scheduled yet) the remaining ones are skipped.
+    for batch_start in range(1, MAX_JORNADAS + 1, MAX_WORKERS):
+        if empty_streak >= EMPTY_JORNADA_LIMIT:
+            break
+        jornadas = range(batch_start, min(batch_start + MAX_WORKERS, MAX_JORNADAS + 1))
+        urls = [
+            f"{ACB_BASE_URL}/calendario/index/temporada_id/{SEASON_ID}/competicion_id/1/jornada_numero/{jornada}"
+            for jornada in jornadas
+        ]
+
+        for jornada, html in zip(jornadas, fetch_pages(urls)):
+            # A failed download says nothing about whether the jornada is empty,
+            # so it neither extends nor resets the streak.
+            if not html:
+                logger.warning(f"  Jornada {jornada}: calendar page could not be fetched, skipping")
+                continue
 
-    # Fetch calendar page for each jornada
-    for jornada in range(1, 35):  # 34 regular season rounds
-        url = f"{ACB_BASE_URL}/calendario/index/temporada_id/{SEASON_ID}/competicion_id/1/jornada_numero/{jornada}"
-        html = fetch_page(url)
-
-        if not html:
-            continue
-
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Find all game containers
-        game_containers = soup.find_all('div', class_='partido')
-        if not game_containers:
-            game_containers = soup.find_all('article', class_='partido')
-
-        for container in game_containers:
-            match_data = {
-                'jornada': jornada,
-                'round': str(jornada),
-            }
-
-            # Find match ID from stats link
-            stats_link = container.find('a', href=re.compile(r'/partido/estadisticas/id/\d+'))
-            if stats_link:
-                href = stats_link.get('href', '')
-                match_id_match = re.search(r'/partido/estadisticas/id/(\d+)', href)
-                if match_id_match:
-                    match_data['match_id'] = match_id_match.group(1)
-
-            # Find team names
-            team_elements = container.find_all('span', class_='nombre_equipo')
-            if not team_elements:
-                team_elements = container.find_all('div', class_='equipo')
-            if len(team_elements) >= 2:
-                match_data['home_team'] = team_elements[0].get_text(strip=True)
-                match_data['away_team'] = team_elements[1].get_text(strip=True)
-
-            # Find scores
-            score_elements = container.find_all('span', class_='resultado')
-            if not score_elements:
-                score_elements = container.find_all('div', class_='resultado')
-            if len(score_elements) >= 2:
-                try:
-                    match_data['home_score'] = int(score_elements[0].get_text(strip=True))
-                    match_data['away_score'] = int(score_elements[1].get_text(strip=True))
-                    match_data['played'] = True
-                except (ValueError, TypeError):
-                    match_data['played'] = False
-            else:
-                match_data['played'] = False
+            matches_before = len(matches)
+            parse_jornada(jornada, html, matches, seen_match_ids)
 
-            # Find date
-            date_element = container.find('span', class_='fecha')
-            if not date_element:
-                date_element = container.find('div', class_='fecha')
-            if date_element:
-                match_data['date_str'] = date_element.get_text(strip=True)
-
-            # Only add if we have a match_id or team names
-            if match_data.get('match_id') or (match_data.get('home_team') and match_data.get('away_team')):
-                # Avoid duplicates
-                if match_data.get('match_id') not in [m.get('match_id') for m in matches]:
-                    matches.append(match_data)
-
-        # Also look for match links directly (fallback)
-        if not game_containers:
-            for link in soup.find_all('a', href=re.compile(r'/partido/estadisticas/id/\d+')):
-                href = link.get('href', '')
-                match_id_match = re.search(r'/partido/estadisticas/id/(\d+)', href)
-                if match_id_match:
-                    match_id = match_id_match.group(1)
-                    if match_id not in [m.get('match_id') for m in matches]:
-                        matches.append({
-                            'match_id': match_id,
-                            'jornada': jornada,
-                            'round': str(jornada),
-                        })
-
-        logger.info(f"  Jornada {jornada}: {len(matches)} total matches")
-        time.sleep(0.3)
+            if len(matches) == matches_before:
+                empty_streak += 1
+                if empty_streak >= EMPTY_JORNADA_LIMIT:
+                    logger.info(f"  No new matches in {empty_streak} consecutive jornadas, stopping at jornada {jornada}")
+                    break
+            else:
+                empty_streak = 0
 
     return matches
 
 
+def parse_jornada(jornada, html, matches, seen_match_ids):
+    """
+    Parse one jornada's calendar page, appending unseen matches to `matches`.
+    """
+    if not html:
+        return
+
+    soup = BeautifulSoup(html, 'lxml', parse_only=MATCH_CONTAINERS_ONLY)
+
+    # Find all game containers
+    game_containers = soup.find_all('div', class_='partido')
+    if not game_containers:
+        game_containers = soup.find_all('article', class_='partido')
+
+    for container in game_containers:
+        match_data = {
+            'jornada': jornada,
+            'round': str(jornada),
+        }
+
+        # Find match ID from stats link
+        stats_link = container.find('a', href=MATCH_HREF_RE)
+        if stats_link:
+            href = stats_link.get('href', '')
+            match_id_match = MATCH_HREF_RE.search(href)
+            if match_id_match:
+                match_data['match_id'] = match_id_match.group(1)
+
+        # Find team names
+        team_elements = container.find_all('span', class_='nombre_equipo')
+        if not team_elements:
+            team_elements = container.find_all('div', class_='equipo')
+        if len(team_elements) >= 2:
+            match_data['home_team'] = team_elements[0].get_text(strip=True)
+            match_data['away_team'] = team_elements[1].get_text(strip=True)
+
+        # Find scores
+        score_elements = container.find_all('span', class_='resultado')
+        if not score_elements:
+            score_elements = container.find_all('div', class_='resultado')
+        if len(score_elements) >= 2:
+            try:
+                match_data['home_score'] = int(score_elements[0].get_text(strip=True))
+                match_data['away_score'] = int(score_elements[1].get_text(strip=True))
+                match_data['played'] = True
+            except (ValueError, TypeError):
+                match_data['played'] = False
+        else:
+            match_data['played'] = False
+
+        # Find date
+        date_element = container.find('span', class_='fecha')
+        if not date_element:
+            date_element = container.find('div', class_='fecha')
+        if date_element:
+            match_data['date_str'] = date_element.get_text(strip=True)
+
+        # Only add if we have a match_id or team names
+        if match_data.get('match_id') or (match_data.get('home_team') and match_data.get('away_team')):
+            # Avoid duplicates
+            if match_data.get('match_id') not in seen_match_ids:
+                seen_match_ids.add(match_data.get('match_id'))
+                matches.append(match_data)
+
+    # Also look for match links directly (fallback)
+    if not game_containers:
+        for link in find_links(html, '/partido/estadisticas/id/'):
+            href = link.get('href', '')
+            match_id_match = MATCH_HREF_RE.search(href)
+            if match_id_match:
+                match_id = match_id_match.group(1)
+                if match_id not in seen_match_ids:
+                    seen_match_ids.add(match_id)
+                    matches.append({
+                        'match_id': match_id,
+                        'jornada': jornada,
+                        'round': str(jornada),
+                    })
+
+    logger.info(f"  Jornada {jornada}: {len(matches)} total matches")
+
+
 def main():
     """Main entry point."""
     logger.info("=" * 60)
@@ -610,77 +844,96 @@ def main():
     matches = fetch_season_matches()
     logger.info(f"Found {len(matches)} matches")
 
-    # Fetch box scores for first 20 matches (to avoid rate limiting)
+    # Box scores are streamed to disk as they are fetched; only the American
+    # performances and the set of match IDs with a box score stay in memory
     logger.info("Fetching box scores...")
-    box_scores = []
     american_performances = []
+    box_score_ids = set()
 
     # Get IDs from confirmed Americans AND match by name from box scores
     american_ids = set(p.get('acb_id') for p in american_players if p.get('acb_id'))
 
-    for i, match in enumerate(matches):  # Get ALL games for complete history
-        match_id = match.get('match_id')
-        if not match_id:
-            continue  # Skip matches without box score links (future games)
-        box_score = fetch_box_score(match_id)
-
-        if box_score and box_score.get('players'):
-            box_scores.append(box_score)
-
-            # Extract American player performances by ID or name
-            for player_stat in box_score['players']:
-                player_name = player_stat.get('name', '')
-                is_american = player_stat.get('acb_id') in american_ids or is_known_american(player_name)
-
-                if is_american:
-                    player_stat['match_id'] = match_id
-                    player_stat['jornada'] = match.get('jornada')
-                    american_performances.append(player_stat)
-
-                    # Also add to american_players if not already there
-                    acb_id = player_stat.get('acb_id')
-                    if acb_id and acb_id not in american_ids:
-                        american_ids.add(acb_id)
-                        # Add to american_players list
-                        american_players.append({
-                            'acb_id': acb_id,
-                            'name': player_name,
-                            'nationality': 'USA (matched)',
-                        })
-
-        if (i + 1) % 20 == 0:
-            logger.info(f"  Progress: {i+1}/{len(matches)}")
-
-        time.sleep(0.5)
+    # Skip matches without box score links (future games)
+    matches_with_ids = [m for m in matches if m.get('match_id')]
+
+    def iter_box_scores(executor):
+        """Yield box scores in match order, collecting American performances on the way."""
+        # Fetch ALL box scores concurrently for complete history; results come back in match order
+        fetched = executor.map(fetch_box_score, [m['match_id'] for m in matches_with_ids])
+
+        for i, (match, box_score) in enumerate(zip(matches_with_ids, fetched)):
+            match_id = match['match_id']
+
+            if box_score and box_score.get('players'):
+                box_score_ids.add(match_id)
+
+                # Extract American player performances by ID or name
+                for player_stat in box_score['players']:
+                    player_name = player_stat.get('name', '')
+                    is_american = player_stat.get('acb_id') in american_ids or is_known_american(player_name)
+
+                    if is_american:
+                        player_stat['match_id'] = match_id
+                        player_stat['jornada'] = match.get('jornada')
+                        american_performances.append(player_stat)
+
+                        # Also add to american_players if not already there
+                        acb_id = player_stat.get('acb_id')
+                        if acb_id and acb_id not in american_ids:
+                            american_ids.add(acb_id)
+                            # Add to american_players list
+                            american_players.append({
+                                'acb_id': acb_id,
+                                'name': player_name,
+                                'nationality': 'USA (matched)',
+                            })
+
+                yield box_score
+
+            if (i + 1) % 20 == 0:
+                logger.info(f"  Progress: {i+1}/{len(matches_with_ids)}")
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        boxscores_path, box_score_count = stream_json_array(
+            f'acb_boxscores_{timestamp}.json',
+            {
+                'export_date': datetime.now().isoformat(),
+                'season': '2025-2026',
+                'league': 'Liga ACB',
+            },
+            'box_scores',
+            iter_box_scores(executor),
+            'match_count',
+        )
 
     # =========================================================================
     # Step 5: Aggregate Player Stats
     # =========================================================================
-    player_game_logs = {}
+    # Group game logs and accumulate points/rebounds/assists in a single pass
+    player_game_logs = defaultdict(list)
+    player_totals = defaultdict(lambda: [0, 0, 0])
     for perf in american_performances:
         acb_id = perf.get('acb_id')
         if acb_id:
-            if acb_id not in player_game_logs:
-                player_game_logs[acb_id] = []
             player_game_logs[acb_id].append(perf)
+            totals = player_totals[acb_id]
+            totals[0] += perf.get('points', 0) or 0
+            totals[1] += perf.get('rebounds', 0) or 0
+            totals[2] += perf.get('assists', 0) or 0
 
-    # Update American players with game logs
+    # Update American players with game logs and averages
     for player in american_players:
         acb_id = player.get('acb_id')
-        if acb_id and acb_id in player_game_logs:
-            player['game_log'] = player_game_logs[acb_id]
-            player['games_tracked'] = len(player_game_logs[acb_id])
-
-            # Calculate averages from game log
-            games = player_game_logs[acb_id]
-            if games:
-                total_pts = sum(g.get('points', 0) or 0 for g in games)
-                total_reb = sum(g.get('rebounds', 0) or 0 for g in games)
-                total_ast = sum(g.get('assists', 0) or 0 for g in games)
-                n = len(games)
-                player['calculated_ppg'] = round(total_pts / n, 1)
-                player['calculated_rpg'] = round(total_reb / n, 1)
-                player['calculated_apg'] = round(total_ast / n, 1)
+        games = player_game_logs.get(acb_id) if acb_id else None
+        if games:
+            player['game_log'] = games
+            player['games_tracked'] = len(games)
+
+            total_pts, total_reb, total_ast = player_totals[acb_id]
+            n = len(games)
+            player['calculated_ppg'] = round(total_pts / n, 1)
+            player['calculated_rpg'] = round(total_reb / n, 1)
+            player['calculated_apg'] = round(total_ast / n, 1)
 
     # =========================================================================
     # Step 6: Build Schedule from Box Scores
@@ -693,7 +946,7 @@ def main():
         match_id = match.get('match_id')
 
         # Check if we have a box score for this match
-        box = next((b for b in box_scores if b.get('match_id') == match_id), None) if match_id else None
+        has_boxscore = match_id in box_score_ids
 
         game_data = {
             'game_id': match_id,
@@ -703,8 +956,8 @@ def main():
             'home_score': match.get('home_score'),
             'away_score': match.get('away_score'),
             'date': match.get('date_str'),
-            'played': match.get('played', box is not None),
-            'has_boxscore': box is not None,
+            'played': match.get('played', has_boxscore),
+            'has_boxscore': has_boxscore,
         }
         schedule_games.append(game_data)
 
@@ -724,14 +977,6 @@ def main():
         'players': american_players
     }, f'acb_american_players_{timestamp}.json')
 
-    save_json({
-        'export_date': datetime.now().isoformat(),
-        'season': '2025-2026',
-        'league': 'Liga ACB',
-        'match_count': len(box_scores),
-        'box_scores': box_scores
-    }, f'acb_boxscores_{timestamp}.json')
-
     # Save schedule from ACB.com
     save_json({
         'export_date': datetime.now().isoformat(),
@@ -751,13 +996,10 @@ def main():
         'players': american_players
     }, 'acb_american_players_latest.json')
 
-    save_json({
-        'export_date': datetime.now().isoformat(),
-        'season': '2025-2026',
-        'league': 'Liga ACB',
-        'match_count': len(box_scores),
-        'box_scores': box_scores
-    }, 'acb_boxscores_latest.json')
+    # Box scores were already streamed to disk; copy rather than re-serialize
+    latest_boxscores_path = os.path.join(os.path.dirname(boxscores_path), 'acb_boxscores_latest.json')
+    shutil.copyfile(boxscores_path, latest_boxscores_path)
+    logger.info(f"Saved: {latest_boxscores_path}")
 
     save_json({
         'export_date': datetime.now().isoformat(),
@@ -776,7 +1018,7 @@ def main():
     logger.info("=" * 60)
     logger.info(f"Total players: {len(all_players)}")
     logger.info(f"American players: {len(american_players)}")
-    logger.info(f"Matches scraped: {len(box_scores)}")
+    logger.info(f"Matches scraped: {box_score_count}")
     logger.info(f"American performances: {len(american_performances)}")
 
     if american_players:
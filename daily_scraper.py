@@ -19,6 +19,8 @@ WHAT IT DOES:
 HOW TO USE:
     python daily_scraper.py              # Full scrape
     python daily_scraper.py --no-boxscores  # Skip box score fetching
+    python daily_scraper.py --force-refresh # Clear cached HTTP responses, then refetch
+    python daily_scraper.py --no-cache      # Don't read or write the HTTP cache
 
 OUTPUT FILES (saved to output/json/):
     - clubs_TIMESTAMP.json: All Liga ACB teams
@@ -37,14 +39,20 @@ DATA SOURCES:
 # IMPORTS
 # =============================================================================
 import argparse
-import json
+import functools
 import os
 import re
-import requests
+import orjson
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import logging
+import multiprocessing
+import threading
 import time
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from bs4 import BeautifulSoup, SoupStrainer
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -116,15 +124,133 @@ EUROBASKET_TEAM_IDS = {
     'Burgos': '3091',
 }
 
+# Lowercased (name, id) pairs for get_team_id's partial match, in the same order
+EUROBASKET_TEAM_IDS_LOWER = [(name.lower(), tid) for name, tid in EUROBASKET_TEAM_IDS.items()]
+
+# Number of concurrent requests for per-team and per-game fetches
+MAX_WORKERS = 5
+
+# Sustained TheSportsDB request rate across all workers
+API_REQUESTS_PER_SECOND = 3
+
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+# Compiled once at import; these run for every row of every box score.
+PLAYER_LINK_RE = re.compile(r'/player/')
+PLAYER_HREF_RE = re.compile(r'/player/([^/]+)/')
+# A stat cell: a whole number, optionally followed by "(...)" e.g. "14 (50%)".
+# Made-attempted cells such as "5-8" don't match.
+STAT_RE = re.compile(r'\s*(\d+)\s*(?:\(.*)?', re.DOTALL)
+# Player heights: "2.01 m" (metric) or "6 ft 7 in" (imperial)
+METRIC_HEIGHT_RE = re.compile(r'(?<![\d.,])(\d+(?:\.\d+)?)\s*m\b', re.IGNORECASE)
+IMPERIAL_HEIGHT_RE = re.compile(r'(\d+)\s*ft\s*(\d+)', re.IGNORECASE)
+
+# Box score column headers -> stat names
+HEADER_MAP = {
+    'MIN': 'minutes',
+    'PT': 'points', 'PTS': 'points',
+    'RB': 'rebounds', 'REB': 'rebounds',
+    'AS': 'assists', 'AST': 'assists',
+    'ST': 'steals', 'STL': 'steals',
+    'TO': 'turnovers',
+}
+
+# Parse filters: only build the parts of a page that are actually read
+TABLES_ONLY = SoupStrainer('table')
+LINKS_ONLY = SoupStrainer('a', href=True)
+
 HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    # Compressed responses; 'br' is decoded by urllib3 via the brotli package
+    'Accept-Encoding': 'gzip, deflate, br',
 }
 
+# On-disk HTTP cache (keyed on URL + params), with a TTL per endpoint.
+# Teams and finished box scores change rarely and rosters a few times a week;
+# schedule endpoints stay short so each daily run sees new scores.
+# Anything not listed here is cached for CACHE_DEFAULT_EXPIRY.
+CACHE_PATH = os.path.join(os.path.dirname(__file__), 'output', 'cache', 'daily_cache')
+CACHE_DEFAULT_EXPIRY = 3600
+CACHE_EXPIRY = {
+    '*/searchteams.php': 86400,
+    '*/search_all_teams.php': 86400,
+    '*/lookup_all_players.php': 21600,
+    '*/eventsseason.php': 3600,
+    '*/eventspastleague.php': 3600,
+    '*/eventsnextleague.php': 3600,
+    '*/boxScores/*': 604800,
+}
+
+# Shared session: keep-alive connections to TheSportsDB and eurobasket.com are
+# reused across requests, transient failures (connection errors, 429/5xx) are
+# retried with jittered exponential backoff by urllib3 (honouring Retry-After
+# on 429/503), and responses are cached on disk.
+SESSION = requests_cache.CachedSession(
+    CACHE_PATH,
+    backend='sqlite',
+    expire_after=CACHE_DEFAULT_EXPIRY,
+    urls_expire_after=CACHE_EXPIRY,
+)
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=4,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        backoff_max=30,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    ),
+))
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+    Allows bursts of up to `burst` requests, refilled at `rate` requests per second.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1:
+                # Waiting inside the lock queues the other workers behind us
+                time.sleep((1 - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 0
+            else:
+                self.tokens -= 1
+
+
+API_RATE_LIMITER = RateLimiter(API_REQUESTS_PER_SECOND, burst=MAX_WORKERS)
+
+# In-process cache of parsed API responses: (endpoint, params) -> (time, data).
+# Sits in front of the on-disk cache; failed calls are not cached.
+API_CACHE_TTL = 3600
+API_CACHE = {}
+API_CACHE_LOCK = threading.Lock()
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Unbounded: nationality strings are low-cardinality, and the unbounded
+# cache skips the LRU ordering bookkeeping on every hit
+@functools.lru_cache(maxsize=None)
 def is_american(nationality):
     """
     Check if a player is American based on their nationality.
@@ -137,7 +263,37 @@ def is_american(nationality):
     """
     if not nationality:
         return False
-    return nationality.lower() in ['united states', 'usa', 'american']
+    return nationality.lower() in {'united states', 'usa', 'american'}
+
+
+def build_name_matcher(names):
+    """
+    Build a matcher for a collection of lowercase player names.
+
+    The matcher returns True when a name equals, contains, or is contained in
+    any of the names. Exact hits are a set lookup; partial hits take one regex
+    pass (a known name inside the name) and one substring search over the
+    newline-joined names (the name inside a known name).
+
+    PARAMETERS:
+        names (iterable of str): Lowercase names to match against
+
+    RETURNS:
+        function: matcher(name) -> bool
+    """
+    names = frozenset(names)
+    if not names:
+        return lambda name: False
+
+    contains_known = re.compile('|'.join(re.escape(n) for n in names))
+    names_blob = '\n'.join(names)
+
+    def matcher(name):
+        if name in names or contains_known.search(name):
+            return True
+        return '\n' not in name and name in names_blob
+
+    return matcher
 
 
 def save_json(data, filename):
@@ -155,49 +311,86 @@ def save_json(data, filename):
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
 
     logger.info(f"Saved: {filepath}")
     return filepath
 
 
-def api_get(endpoint, params=None, retries=3):
+def stream_json_array(filename, header, array_key, items, count_key):
+    """
+    Save a JSON object whose list is written item by item from an iterable,
+    so the full list (or its serialized form) is never held in memory.
+
+    PARAMETERS:
+        filename (str): The name of the file
+        header (dict): Fields written before the list
+        array_key (str): Key of the list
+        items (iterable): Items of the list
+        count_key (str): Key for the item count, written after the list
+
+    RETURNS:
+        tuple: (full file path, number of items written)
     """
-    Make a GET request to TheSportsDB API with retry logic.
+    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, filename)
+    options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    count = 0
+    with open(filepath, 'wb') as f:
+        f.write(b'{\n')
+        for key, value in header.items():
+            f.write(b'  ' + orjson.dumps(key) + b': ' + orjson.dumps(value, option=options, default=str).replace(b'\n', b'\n  ') + b',\n')
+        f.write(b'  ' + orjson.dumps(array_key) + b': [')
+        for item in items:
+            f.write(b',\n    ' if count else b'\n    ')
+            f.write(orjson.dumps(item, option=options, default=str).replace(b'\n', b'\n    '))
+            count += 1
+        f.write(b'\n  ],\n' if count else b'],\n')
+        f.write(b'  ' + orjson.dumps(count_key) + b': ' + str(count).encode() + b'\n}')
+
+    logger.info(f"Saved: {filepath}")
+    return filepath, count
+
+
+def api_get(endpoint, params=None):
+    """
+    Make a GET request to TheSportsDB API.
+    Retries with exponential backoff are handled by the shared session.
 
     PARAMETERS:
         endpoint (str): The API endpoint (e.g., '/lookup_all_teams.php')
         params (dict, optional): Query parameters
-        retries (int): Number of retry attempts
 
     RETURNS:
         dict or None: The JSON response, or None if error
     """
     url = f"{BASE_URL}{endpoint}"
 
-    for attempt in range(retries):
-        try:
-            # Add delay between requests to avoid rate limiting
-            if attempt > 0:
-                delay = 2 ** attempt  # Exponential backoff: 2, 4, 8 seconds
-                logger.info(f"  Retry {attempt + 1}/{retries} after {delay}s delay...")
-                time.sleep(delay)
-
-            resp = requests.get(url, params=params, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Add small delay after successful request to avoid rate limiting
-            time.sleep(0.5)
-            return data
-        except Exception as e:
-            logger.warning(f"API attempt {attempt + 1}/{retries} failed for {endpoint}: {e}")
-            if attempt == retries - 1:
-                logger.error(f"API error {endpoint}: {e}")
-                return None
+    # In-process cache first: skips both the disk cache lookup and JSON parsing
+    cache_key = (endpoint, frozenset((params or {}).items()))
+    with API_CACHE_LOCK:
+        cached = API_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < API_CACHE_TTL:
+        return cached[1]
 
-    return None
+    try:
+        # Fresh disk cache hits don't touch the API, so they skip the rate limiter
+        resp = SESSION.get(url, params=params, timeout=30, only_if_cached=True)
+        if resp.status_code == 504:
+            API_RATE_LIMITER.acquire()
+            resp = SESSION.get(url, params=params, timeout=30)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+
+        with API_CACHE_LOCK:
+            API_CACHE[cache_key] = (time.monotonic(), data)
+        return data
+    except Exception as e:
+        logger.error(f"API error {endpoint}: {e}")
+        return None
 
 
 # =============================================================================
@@ -230,15 +423,18 @@ def fetch_clubs():
         'Girona', 'Breogan', 'Granada', 'Andorra', 'Fuenlabrada'
     ]
 
-    clubs = []
-    for team_name in known_teams:
-        data = api_get('/searchteams.php', {'t': team_name})
-        if data and data.get('teams'):
-            for team in data['teams']:
-                if team.get('strSport') == 'Basketball' and team.get('strCountry') == 'Spain':
-                    clubs.append(team)
-                    break
-        time.sleep(0.3)  # Rate limiting
+    # Run the searches concurrently; results come back in known_teams order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(lambda team_name: api_get('/searchteams.php', {'t': team_name}), known_teams)
+
+        clubs = []
+        for data in results:
+            if data and data.get('teams'):
+                # First Spanish basketball hit per search
+                match = next((team for team in data['teams']
+                              if team.get('strSport') == 'Basketball' and team.get('strCountry') == 'Spain'), None)
+                if match:
+                    clubs.append(match)
 
     logger.info(f"  Found {len(clubs)} clubs via search")
     return clubs
@@ -259,7 +455,7 @@ def fetch_players_for_team(team_id, team_name):
 
     if data and data.get('player'):
         players = data.get('player', [])
-        logger.info(f"    {team_name}: {len(players)} players")
+        logger.info("    %s: %d players", team_name, len(players))
         return players
 
     return []
@@ -277,19 +473,19 @@ def fetch_all_players(clubs):
     """
     logger.info("Fetching players from all teams...")
 
+    # Fetch rosters concurrently; results come back in club order
+    teams = [(club.get('idTeam'), club.get('strTeam', 'Unknown')) for club in clubs if club.get('idTeam')]
+
     all_players = []
-    for club in clubs:
-        team_id = club.get('idTeam')
-        team_name = club.get('strTeam', 'Unknown')
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        rosters = executor.map(lambda team: fetch_players_for_team(*team), teams)
 
-        if team_id:
-            players = fetch_players_for_team(team_id, team_name)
+        for (team_id, team_name), players in zip(teams, rosters):
             # Add team info to each player
             for player in players:
                 player['team_id'] = team_id
                 player['team_name'] = team_name
             all_players.extend(players)
-            time.sleep(0.3)  # Rate limiting
 
     logger.info(f"  Total players: {len(all_players)}")
     return all_players
@@ -353,86 +549,131 @@ def fetch_schedule():
 # DATA PROCESSING FUNCTIONS
 # =============================================================================
 
+# Output field -> TheSportsDB field, for values that are passed through as-is
+CLUB_FIELDS = {
+    'id': 'idTeam',
+    'name': 'strTeam',
+    'short_name': 'strTeamShort',
+    'founded': 'intFormedYear',
+    'stadium': 'strStadium',
+    'stadium_capacity': 'intStadiumCapacity',
+    'location': 'strLocation',
+    'country': 'strCountry',
+    'badge_url': 'strBadge',
+    'logo_url': 'strLogo',
+    'website': 'strWebsite',
+    'description': 'strDescriptionEN',
+}
+
+# None marks a field computed in process_schedule (kept here for output order)
+SCHEDULE_FIELDS = {
+    'game_id': 'idEvent',
+    'date': 'dateEvent',
+    'time': 'strTime',
+    'round': 'intRound',
+    'home_team': 'strHomeTeam',
+    'away_team': 'strAwayTeam',
+    'home_score': None,
+    'away_score': None,
+    'played': None,
+    'venue': 'strVenue',
+    'city': 'strCity',
+    'season': 'strSeason',
+    'status': 'strStatus',
+    'result': 'strResult',  # Quarter breakdown
+}
+
+
 def process_clubs(clubs):
     """
     Process raw club data into a clean format.
     """
-    processed = []
-    for club in clubs:
-        processed.append({
-            'id': club.get('idTeam'),
-            'name': club.get('strTeam'),
-            'short_name': club.get('strTeamShort'),
-            'founded': club.get('intFormedYear'),
-            'stadium': club.get('strStadium'),
-            'stadium_capacity': club.get('intStadiumCapacity'),
-            'location': club.get('strLocation'),
-            'country': club.get('strCountry'),
-            'badge_url': club.get('strBadge'),
-            'logo_url': club.get('strLogo'),
-            'website': club.get('strWebsite'),
-            'description': club.get('strDescriptionEN'),
-        })
-    return processed
+    return [{field: club.get(source) for field, source in CLUB_FIELDS.items()} for club in clubs]
+
+
+def cm_to_feet_inches(height_cm):
+    """Convert centimetres to (feet, inches), rounding inches and carrying 12 into a foot."""
+    total_inches = height_cm / 2.54
+    height_feet = int(total_inches // 12)
+    height_inches = int(round(total_inches % 12))
+    if height_inches == 12:
+        height_feet += 1
+        height_inches = 0
+    return height_feet, height_inches
+
+
+# Precomputed conversions for the range basketball heights fall in
+CM_TO_FEET_INCHES = {cm: cm_to_feet_inches(cm) for cm in range(150, 240)}
+
+
+@functools.lru_cache(maxsize=256)
+def parse_height(height_str):
+    """
+    Parse a TheSportsDB height string ("2.01 m" or "6 ft 7 in").
+    Cached: heights repeat across the league, so each distinct string is parsed once.
+
+    PARAMETERS:
+        height_str (str or None): The raw height string
+
+    RETURNS:
+        tuple: (height_cm, height_feet, height_inches), each None if unknown
+    """
+    if not height_str:
+        return None, None, None
+
+    height_cm = None
+    metric_match = METRIC_HEIGHT_RE.search(height_str)
+    if metric_match:
+        # Metric format: "2.01 m"
+        height_cm = int(float(metric_match.group(1)) * 100)
+    else:
+        imperial_match = IMPERIAL_HEIGHT_RE.search(height_str)
+        if imperial_match:
+            # Imperial format: "6 ft 7 in"
+            feet, inches = int(imperial_match.group(1)), int(imperial_match.group(2))
+            height_cm = int((feet * 12 + inches) * 2.54)
+
+    if not height_cm:
+        return height_cm, None, None
+
+    # Convert height to feet/inches
+    height_feet, height_inches = CM_TO_FEET_INCHES.get(height_cm) or cm_to_feet_inches(height_cm)
+    return height_cm, height_feet, height_inches
 
 
 def process_players(players):
     """
     Process raw player data into a clean format.
+    Yields one player at a time so callers can stream them.
     """
-    processed = []
     for player in players:
+        get = player.get  # Bound once; used for every field below
+
         # Parse height (format: "2.01 m" or "6 ft 7 in")
-        height_str = player.get('strHeight', '')
-        height_cm = None
-        if height_str:
-            try:
-                if 'm' in height_str.lower():
-                    # Metric format: "2.01 m"
-                    height_m = float(height_str.lower().replace('m', '').strip())
-                    height_cm = int(height_m * 100)
-                elif 'ft' in height_str.lower():
-                    # Imperial format: "6 ft 7 in"
-                    parts = height_str.lower().replace('ft', '').replace('in', '').split()
-                    if len(parts) >= 2:
-                        feet = int(parts[0])
-                        inches = int(parts[1])
-                        height_cm = int((feet * 12 + inches) * 2.54)
-            except:
-                pass
-
-        # Convert height to feet/inches
-        height_feet = None
-        height_inches = None
-        if height_cm:
-            total_inches = height_cm / 2.54
-            height_feet = int(total_inches // 12)
-            height_inches = int(round(total_inches % 12))
-            if height_inches == 12:
-                height_feet += 1
-                height_inches = 0
-
-        processed.append({
-            'code': player.get('idPlayer'),
-            'name': player.get('strPlayer'),
-            'nationality': player.get('strNationality'),
-            'birth_date': player.get('dateBorn', '')[:10] if player.get('dateBorn') else None,
-            'birth_location': player.get('strBirthLocation'),
+        height_str = get('strHeight', '')
+        height_cm, height_feet, height_inches = parse_height(height_str)
+        born = get('dateBorn')
+
+        yield {
+            'code': get('idPlayer'),
+            'name': get('strPlayer'),
+            'nationality': get('strNationality'),
+            'birth_date': born[:10] if born else None,
+            'birth_location': get('strBirthLocation'),
             'height_str': height_str,
             'height_cm': height_cm,
             'height_feet': height_feet,
             'height_inches': height_inches,
-            'weight': player.get('strWeight'),
-            'position': player.get('strPosition'),
-            'team_code': player.get('team_id'),
-            'team_name': player.get('team_name'),
-            'jersey': player.get('strNumber'),
-            'headshot_url': player.get('strThumb') or player.get('strCutout'),
-            'description': player.get('strDescriptionEN'),
-            'instagram': player.get('strInstagram'),
-            'twitter': player.get('strTwitter'),
-        })
-    return processed
+            'weight': get('strWeight'),
+            'position': get('strPosition'),
+            'team_code': get('team_id'),
+            'team_name': get('team_name'),
+            'jersey': get('strNumber'),
+            'headshot_url': get('strThumb') or get('strCutout'),
+            'description': get('strDescriptionEN'),
+            'instagram': get('strInstagram'),
+            'twitter': get('strTwitter'),
+        }
 
 
 def process_schedule(games):
@@ -441,44 +682,81 @@ def process_schedule(games):
     """
     processed = []
     for game in games:
+        get = game.get
+        row = {field: get(source) if source else None for field, source in SCHEDULE_FIELDS.items()}
+
         # Determine if game is played based on score
-        home_score = game.get('intHomeScore')
-        away_score = game.get('intAwayScore')
-        played = home_score is not None and away_score is not None
-
-        processed.append({
-            'game_id': game.get('idEvent'),
-            'date': game.get('dateEvent'),
-            'time': game.get('strTime'),
-            'round': game.get('intRound'),
-            'home_team': game.get('strHomeTeam'),
-            'away_team': game.get('strAwayTeam'),
-            'home_score': int(home_score) if home_score else None,
-            'away_score': int(away_score) if away_score else None,
-            'played': played,
-            'venue': game.get('strVenue'),
-            'city': game.get('strCity'),
-            'season': game.get('strSeason'),
-            'status': game.get('strStatus'),
-            'result': game.get('strResult'),  # Quarter breakdown
-        })
+        home_score = get('intHomeScore')
+        away_score = get('intAwayScore')
+        row['played'] = home_score is not None and away_score is not None
+
+        # Explicit checks so a 0-point score isn't mistaken for "no score"
+        if home_score not in (None, ''):
+            row['home_score'] = int(home_score)
+        if away_score not in (None, ''):
+            row['away_score'] = int(away_score)
+
+        processed.append(row)
     return processed
 
 
+def aggregate_player_stats(performances):
+    """
+    Aggregate box score performances into per-player season totals and averages.
+
+    PARAMETERS:
+        performances (list): Performance dictionaries with player_name/points/rebounds/assists
+
+    RETURNS:
+        list: One summary dictionary per player, sorted by PPG (highest first)
+    """
+    player_stats = {}
+    for perf in performances:
+        name = perf.get('player_name', 'Unknown')
+
+        # One dict lookup per performance; create the entry on first sight
+        ps = player_stats.get(name)
+        if ps is None:
+            ps = player_stats[name] = {
+                'player_name': name,
+                'games_played': 0,
+                'total_points': 0,
+                'total_rebounds': 0,
+                'total_assists': 0,
+                'performances': []
+            }
+
+        ps['games_played'] += 1
+        ps['total_points'] += perf.get('points', 0) or 0
+        ps['total_rebounds'] += perf.get('rebounds', 0) or 0
+        ps['total_assists'] += perf.get('assists', 0) or 0
+        ps['performances'].append(perf)
+
+    # Calculate averages (every entry has at least one game)
+    for ps in player_stats.values():
+        gp = ps['games_played']
+        ps['ppg'] = round(ps['total_points'] / gp, 1)
+        ps['rpg'] = round(ps['total_rebounds'] / gp, 1)
+        ps['apg'] = round(ps['total_assists'] / gp, 1)
+
+    return sorted(player_stats.values(), key=lambda x: x['ppg'], reverse=True)
+
+
 # =============================================================================
 # EUROBASKET.COM BOX SCORE SCRAPING
 # =============================================================================
 
+@functools.lru_cache(maxsize=256)
 def get_team_id(team_name):
-    """Get eurobasket.com team ID from team name."""
+    """Get eurobasket.com team ID from team name (cached: team names repeat every game)."""
     # Try exact match first
     if team_name in EUROBASKET_TEAM_IDS:
         return EUROBASKET_TEAM_IDS[team_name]
 
     # Try partial match
     team_lower = team_name.lower()
-    for name, tid in EUROBASKET_TEAM_IDS.items():
-        if name.lower() in team_lower or team_lower in name.lower():
+    for name_lower, tid in EUROBASKET_TEAM_IDS_LOWER:
+        if name_lower in team_lower or team_lower in name_lower:
             return tid
 
     return None
@@ -499,9 +777,9 @@ def fetch_eurobasket_schedule():
     }
 
     try:
-        resp = requests.get(EUROBASKET_SCHEDULE_URL, params=params, headers=HEADERS, timeout=30)
+        resp = SESSION.get(EUROBASKET_SCHEDULE_URL, params=params, timeout=30)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = BeautifulSoup(resp.text, 'lxml', parse_only=LINKS_ONLY)
 
         games = []
         # Find all box score links
@@ -528,7 +806,7 @@ def parse_boxscore_page(html, game_url):
     Note: eurobasket.com obfuscates player names in the displayed text,
     but the real names are in the href URLs (e.g., /player/Miles-Norris/442259)
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml', parse_only=TABLES_ONLY)
     performances = []
 
     # Find all tables
@@ -548,20 +826,12 @@ def parse_boxscore_page(html, game_url):
         for row_idx, row in enumerate(rows[:3]):
             cells = row.find_all(['td', 'th'])
             for idx, cell in enumerate(cells):
-                text = cell.get_text(strip=True).upper()
-                if text == 'MIN':
-                    col_map['minutes'] = idx
-                    header_row_idx = row_idx
-                elif text == 'PT' or text == 'PTS':
-                    col_map['points'] = idx
-                elif text == 'RB' or text == 'REB':
-                    col_map['rebounds'] = idx
-                elif text == 'AS' or text == 'AST':
-                    col_map['assists'] = idx
-                elif text == 'ST' or text == 'STL':
-                    col_map['steals'] = idx
-                elif text == 'TO':
-                    col_map['turnovers'] = idx
+                stat_name = HEADER_MAP.get(cell.get_text(strip=True).upper())
+                if stat_name:
+                    col_map[stat_name] = idx
+                    # The minutes column marks the header row
+                    if stat_name == 'minutes':
+                        header_row_idx = row_idx
 
         # Skip if no valid header found
         if not col_map or header_row_idx < 0:
@@ -574,12 +844,12 @@ def parse_boxscore_page(html, game_url):
                 continue
 
             # Extract player name from href URL (real names are there)
-            player_link = row.find('a', href=lambda x: x and '/player/' in str(x))
+            player_link = row.find('a', href=PLAYER_LINK_RE)
             if not player_link:
                 continue
 
             href = player_link.get('href', '')
-            name_match = re.search(r'/player/([^/]+)/', href)
+            name_match = PLAYER_HREF_RE.search(href)
             if not name_match:
                 continue
 
@@ -598,16 +868,11 @@ def parse_boxscore_page(html, game_url):
             try:
                 for stat_name, col_idx in col_map.items():
                     if col_idx < len(cells):
-                        cell_text = cells[col_idx].get_text(strip=True)
-                        # Handle "XX (YY%)" format
-                        cell_text = cell_text.split('(')[0].strip()
-                        # Handle "X-Y" format (made-attempted) - we don't want this for stats
-                        if '-' in cell_text:
-                            continue  # Skip shooting stats format
-                        if cell_text.isdigit():
-                            perf[stat_name] = int(cell_text)
+                        stat_match = STAT_RE.fullmatch(cells[col_idx].get_text(strip=True))
+                        if stat_match:
+                            perf[stat_name] = int(stat_match.group(1))
             except Exception as e:
-                logger.debug(f"Error parsing stats: {e}")
+                logger.debug("Error parsing stats: %s", e)
 
             # Only add if we got some stats
             if perf.get('points') is not None or perf.get('minutes') is not None:
@@ -616,16 +881,31 @@ def parse_boxscore_page(html, game_url):
     return performances
 
 
-def fetch_boxscore(url):
+def fetch_boxscore_html(url):
     """
-    Fetch and parse a single box score from eurobasket.com.
+    Fetch the HTML of a single box score page from eurobasket.com.
+    Returns None if the page could not be fetched.
     """
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
+        resp = SESSION.get(url, timeout=30)
         resp.raise_for_status()
-        return parse_boxscore_page(resp.text, url)
+        return resp.text
     except Exception as e:
-        logger.debug(f"Error fetching boxscore {url}: {e}")
+        logger.debug("Error fetching boxscore %s: %s", url, e)
+        return None
+
+
+def parse_boxscore(html, url):
+    """
+    Parse a fetched box score page; runs in a worker process.
+    Returns an empty list for a missing or unparseable page.
+    """
+    if not html:
+        return []
+    try:
+        return parse_boxscore_page(html, url)
+    except Exception as e:
+        logger.debug("Error parsing boxscore %s: %s", url, e)
         return []
 
 
@@ -643,47 +923,49 @@ def fetch_all_boxscores(games, american_players):
     logger.info("Fetching box scores from eurobasket.com...")
 
     # Build set of American player names for matching
+    # (lowercased once per player; variations are built from the lowercase parts)
     american_names = set()
     for p in american_players:
-        name = p.get('name', '')
-        american_names.add(name.lower())
+        name_lower = p.get('name', '').lower()
+        american_names.add(name_lower)
         # Also add variations
-        parts = name.split()
+        parts = name_lower.split()
         if len(parts) >= 2:
-            american_names.add(f"{parts[-1]}, {parts[0]}".lower())  # Last, First
-            american_names.add(parts[-1].lower())  # Just last name
+            american_names.add(f"{parts[-1]}, {parts[0]}")  # Last, First
+            american_names.add(parts[-1])  # Just last name
+    is_american_name = build_name_matcher(american_names)
 
     all_performances = []
 
     # Get box score URLs from eurobasket schedule
     eurobasket_games = fetch_eurobasket_schedule()
 
-    # Fetch each box score
-    for i, game in enumerate(eurobasket_games[:50]):  # Limit to 50 games
-        url = game.get('boxscore_url')
-        if not url:
-            continue
-
-        if (i + 1) % 10 == 0:
-            logger.info(f"  Progress: {i+1}/{len(eurobasket_games[:50])}")
-
-        performances = fetch_boxscore(url)
-
-        # Filter to American players
-        for perf in performances:
-            player_name = perf.get('player_name', '').lower()
-
-            # Check if this is an American player
-            is_american = False
-            for am_name in american_names:
-                if am_name in player_name or player_name in am_name:
-                    is_american = True
-                    break
-
-            if is_american:
-                all_performances.append(perf)
-
-        time.sleep(0.3)  # Rate limiting
+    # Fetch every box score on the schedule (duplicate links only once)
+    urls = list(dict.fromkeys(game.get('boxscore_url') for game in eurobasket_games))
+    urls = [url for url in urls if url]
+
+    # Pages are fetched on threads (I/O bound) and parsed in worker processes
+    # (CPU bound); each parse is submitted as soon as its page arrives.
+    # Workers are spawned rather than forked: by the time the first parse is
+    # submitted the fetch threads are running, and forking a threaded process
+    # (along with its open SQLite cache connection) can deadlock the child.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as fetch_executor, \
+            ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as parse_executor:
+        fetch_futures = {fetch_executor.submit(fetch_boxscore_html, url): idx for idx, url in enumerate(urls)}
+        parse_futures = [None] * len(urls)
+
+        for done, future in enumerate(as_completed(fetch_futures), 1):
+            idx = fetch_futures[future]
+            parse_futures[idx] = parse_executor.submit(parse_boxscore, future.result(), urls[idx])
+            if done % 10 == 0:
+                logger.info("  Progress: %d/%d", done, len(urls))
+
+        # Filter to American players, in schedule order so the output
+        # doesn't depend on which page happened to finish first
+        for parse_future in parse_futures:
+            for perf in parse_future.result():
+                if is_american_name(perf.get('player_name', '').lower()):
+                    all_performances.append(perf)
 
     logger.info(f"  Found {len(all_performances)} American player performances")
     return all_performances
@@ -706,14 +988,33 @@ def main():
                        help='Only fetch schedule')
     parser.add_argument('--no-boxscores', action='store_true',
                        help='Skip fetching box scores')
+    parser.add_argument('--force-refresh', action='store_true',
+                       help='Clear the HTTP cache and refetch everything')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Bypass the HTTP cache for this run (neither read nor written)')
     args = parser.parse_args()
 
+    if args.force_refresh:
+        logger.info("Clearing HTTP cache...")
+        SESSION.cache.clear()
+    if args.no_cache:
+        logger.info("HTTP cache disabled for this run")
+        SESSION.settings.disabled = True
+
     logger.info("=" * 60)
     logger.info("LIGA ACB DAILY SCRAPER")
     logger.info("=" * 60)
 
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
+    # The schedule doesn't depend on clubs or players, so fetch it in the
+    # background while the roster requests run (picked up in step 3)
+    schedule_future = None
+    if not (args.teams_only or args.players_only):
+        background = ThreadPoolExecutor(max_workers=1)
+        schedule_future = background.submit(fetch_schedule)
+        background.shutdown(wait=False)  # The submitted fetch still runs to completion
+
     # =========================================================================
     # Step 1: Fetch Clubs
     # =========================================================================
@@ -737,21 +1038,32 @@ def main():
     # Step 2: Fetch Players
     # =========================================================================
     all_players_raw = fetch_all_players(clubs)
-    all_players = process_players(all_players_raw)
 
-    # Identify American players
-    american_players = [p for p in all_players if is_american(p.get('nationality'))]
+    # Stream processed players straight to disk, keeping only the Americans
+    american_players = []
 
-    logger.info(f"  American players: {len(american_players)}")
+    def collect_americans(players):
+        """Pass players through, keeping the American ones."""
+        for player in players:
+            if is_american(player.get('nationality')):
+                american_players.append(player)
+            yield player
 
     # Save all players
-    save_json({
-        'export_date': datetime.now().isoformat(),
-        'season': SEASON,
-        'league': 'Liga ACB',
-        'count': len(all_players),
-        'players': all_players
-    }, f'players_{timestamp}.json')
+    _, player_count = stream_json_array(
+        f'players_{timestamp}.json',
+        {
+            'export_date': datetime.now().isoformat(),
+            'season': SEASON,
+            'league': 'Liga ACB',
+        },
+        'players',
+        collect_americans(process_players(all_players_raw)),
+        'count',
+    )
+    del all_players_raw  # Raw API dicts are no longer needed
+
+    logger.info(f"  American players: {len(american_players)}")
 
     # Save American players
     save_json({
@@ -768,7 +1080,7 @@ def main():
     # =========================================================================
     # Step 3: Fetch Schedule
     # =========================================================================
-    games_raw = fetch_schedule()
+    games_raw = schedule_future.result()
     games = process_schedule(games_raw)
 
     played_games = [g for g in games if g.get('played')]
@@ -799,48 +1111,20 @@ def main():
 
         if all_american_performances:
             # Save raw performances
-            save_json({
-                'export_date': datetime.now().isoformat(),
-                'season': SEASON,
-                'league': 'Liga ACB',
-                'performance_count': len(all_american_performances),
-                'performances': all_american_performances
-            }, f'american_performances_{timestamp}.json')
-
-            # Calculate season averages
-            player_stats = {}
-            for perf in all_american_performances:
-                name = perf.get('player_name', 'Unknown')
-
-                if name not in player_stats:
-                    player_stats[name] = {
-                        'player_name': name,
-                        'games_played': 0,
-                        'total_points': 0,
-                        'total_rebounds': 0,
-                        'total_assists': 0,
-                        'performances': []
-                    }
-
-                ps = player_stats[name]
-                ps['games_played'] += 1
-                ps['total_points'] += perf.get('points', 0) or 0
-                ps['total_rebounds'] += perf.get('rebounds', 0) or 0
-                ps['total_assists'] += perf.get('assists', 0) or 0
-                ps['performances'].append(perf)
-
-            # Calculate averages
-            for ps in player_stats.values():
-                gp = ps['games_played']
-                if gp > 0:
-                    ps['ppg'] = round(ps['total_points'] / gp, 1)
-                    ps['rpg'] = round(ps['total_rebounds'] / gp, 1)
-                    ps['apg'] = round(ps['total_assists'] / gp, 1)
-
-            # Sort by PPG
-            player_summary = sorted(player_stats.values(),
-                                   key=lambda x: x.get('ppg', 0),
-                                   reverse=True)
+            stream_json_array(
+                f'american_performances_{timestamp}.json',
+                {
+                    'export_date': datetime.now().isoformat(),
+                    'season': SEASON,
+                    'league': 'Liga ACB',
+                },
+                'performances',
+                all_american_performances,
+                'performance_count',
+            )
+
+            # Calculate season averages, sorted by PPG
+            player_summary = aggregate_player_stats(all_american_performances)
 
             save_json({
                 'export_date': datetime.now().isoformat(),
@@ -857,7 +1141,7 @@ def main():
     logger.info("SUMMARY")
     logger.info("=" * 60)
     logger.info(f"Clubs: {len(processed_clubs)}")
-    logger.info(f"Total players: {len(all_players)}")
+    logger.info(f"Total players: {player_count}")
     logger.info(f"American players: {len(american_players)}")
     logger.info(f"Games: {len(games)} (played: {len(played_games)}, upcoming: {len(upcoming_games)})")
     logger.info(f"American performances: {len(all_american_performances)}")
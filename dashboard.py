@@ -18,10 +18,11 @@ FEATURES:
     - See upcoming games schedule
 """
 
-import json
 import os
 from glob import glob
-from flask import Flask, render_template_string, request
+import orjson
+from flask import Flask, render_template, request, send_from_directory
+from werkzeug.security import safe_join
 
 # =============================================================================
 # FLASK APP SETUP
@@ -32,34 +33,86 @@ app = Flask(__name__)
 # DATA LOADING
 # =============================================================================
 
-def load_latest_data():
-    """Load the most recent unified player data."""
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
-    files = sorted(glob(os.path.join(output_dir, 'american_players_summary_*.json')))
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'output', 'json')
 
-    if not files:
-        return {'players': [], 'export_date': 'No data'}
+# Pre-rendered pages (see build_static); served while newer than their data file
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'output', 'html')
+STATIC_MAX_AGE = 3600
 
-    with open(files[-1], 'r', encoding='utf-8') as f:
-        return json.load(f)
+# Parsed JSON per file pattern, reused until the newest file changes on disk.
+# pattern -> {'path': ..., 'mtime': ..., 'data': ..., plus any derived indexes}
+DATA_CACHE = {}
 
 
-def load_player_detail(player_code):
-    """Load full player data including all details."""
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
-    files = sorted(glob(os.path.join(output_dir, 'unified_american_players_*.json')))
+def load_cached_json(pattern, build_indexes=None):
+    """
+    Load the newest file matching `pattern`, parsing it only when it changed.
 
+    `build_indexes(data)` may return extra keys (e.g. filter options) that are
+    computed once per file version and stored alongside the data.
+    Returns the cache entry dict, or None if no file matches.
+    """
+    files = sorted(glob(os.path.join(OUTPUT_DIR, pattern)))
     if not files:
         return None
 
-    with open(files[-1], 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    path = files[-1]
+    mtime = os.stat(path).st_mtime
+    entry = DATA_CACHE.get(pattern)
+    if entry and entry['path'] == path and entry['mtime'] == mtime:
+        return entry
+
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+
+    entry = {'path': path, 'mtime': mtime, 'data': data}
+    if build_indexes:
+        entry.update(build_indexes(data))
+    DATA_CACHE[pattern] = entry
+    return entry
+
+
+def summary_indexes(data):
+    """Players bucketed by team and by state, plus the filter dropdown options."""
+    by_team = {}
+    by_state = {}
+    for p in data.get('players', []):
+        if p.get('team'):
+            by_team.setdefault(p['team'], []).append(p)
+        if p.get('hometown_state'):
+            by_state.setdefault(p['hometown_state'], []).append(p)
+    return {
+        'by_team': by_team,
+        'by_state': by_state,
+        'teams': tuple(sorted(by_team)),
+        'states': tuple(sorted(by_state)),
+    }
+
+
+def unified_indexes(data):
+    """Player code -> full record, for O(1) detail page lookups."""
+    return {'by_code': {p.get('code'): p for p in data.get('players', [])}}
+
+
+def load_latest_entry():
+    """Cache entry for the most recent player summary (data plus filter options)."""
+    return load_cached_json('american_players_summary_*.json', summary_indexes)
+
+
+def load_latest_data():
+    """Load the most recent unified player data."""
+    entry = load_latest_entry()
+    if not entry:
+        return {'players': [], 'export_date': 'No data'}
+    return entry['data']
 
-    for player in data.get('players', []):
-        if player.get('code') == player_code:
-            return player
 
-    return None
+def load_player_detail(player_code):
+    """Load full player data including all details."""
+    entry = load_cached_json('unified_american_players_*.json', unified_indexes)
+    if not entry:
+        return None
+    return entry['by_code'].get(player_code)
 
 
 # =============================================================================
@@ -418,42 +471,48 @@ PLAYER_TEMPLATE = """
 """
 
 
+def compile_page(page_template):
+    """Inline a page template into BASE_TEMPLATE and compile it once."""
+    source = BASE_TEMPLATE.replace('{% block content %}{% endblock %}',
+                                   page_template.replace('{% extends "base" %}', ''))
+    return app.jinja_env.from_string(source)
+
+
+# Compiled at import so requests skip Jinja parsing/compilation
+HOME_PAGE = compile_page(HOME_TEMPLATE)
+PLAYER_PAGE = compile_page(PLAYER_TEMPLATE)
+
+
 # =============================================================================
-# ROUTES
+# PAGE RENDERING
 # =============================================================================
 
-@app.route('/')
-def home():
-    """Main page showing all players with filtering options."""
-    data = load_latest_data()
+def render_home(search='', selected_team='', selected_state='', sort_by='name'):
+    """Render the player list with the given filters and sort order."""
+    entry = load_latest_entry()
+    data = entry['data'] if entry else {'players': [], 'export_date': 'No data'}
     players = data.get('players', [])
     export_date = data.get('export_date', 'Unknown')
 
-    # Get filter parameters
-    search = request.args.get('search', '').lower()
-    selected_team = request.args.get('team', '')
-    selected_state = request.args.get('state', '')
-    sort_by = request.args.get('sort', 'name')
+    # Apply filters: narrow by the team/state buckets first, so the name
+    # search only scans the matching players
+    if selected_team:
+        players = entry['by_team'].get(selected_team, []) if entry else []
+        if selected_state:
+            players = [p for p in players if p.get('hometown_state') == selected_state]
+    elif selected_state:
+        players = entry['by_state'].get(selected_state, []) if entry else []
 
-    # Apply filters
     if search:
         players = [p for p in players if search in p.get('name', '').lower()]
 
-    if selected_team:
-        players = [p for p in players if p.get('team') == selected_team]
-
-    if selected_state:
-        players = [p for p in players if p.get('hometown_state') == selected_state]
-
     # Sort
     sort_key = sort_by if sort_by in ['name', 'team'] else 'name'
     players = sorted(players, key=lambda p: p.get(sort_key) or '')
 
-    # Get unique teams and states for filter dropdowns
-    all_data = load_latest_data()
-    all_players = all_data.get('players', [])
-    teams = sorted(set(p.get('team') for p in all_players if p.get('team')))
-    states = sorted(set(p.get('hometown_state') for p in all_players if p.get('hometown_state')))
+    # Unique teams and states for filter dropdowns (computed once per data file)
+    teams = entry['teams'] if entry else ()
+    states = entry['states'] if entry else ()
 
     # Build query string for sort links
     query_parts = []
@@ -465,9 +524,8 @@ def home():
         query_parts.append(f"state={selected_state}")
     query_string = '&'.join(query_parts)
 
-    return render_template_string(
-        BASE_TEMPLATE.replace('{% block content %}{% endblock %}',
-                              HOME_TEMPLATE.replace('{% extends "base" %}', '')),
+    return render_template(
+        HOME_PAGE,
         players=players,
         export_date=export_date,
         teams=teams,
@@ -479,19 +537,104 @@ def home():
     )
 
 
+def render_player(player):
+    """Render a player detail page."""
+    return render_template(
+        PLAYER_PAGE,
+        player=player
+    )
+
+
+# =============================================================================
+# STATIC BUILD
+# =============================================================================
+
+def write_page(relative_path, html):
+    """Write one pre-rendered page under STATIC_DIR."""
+    path = os.path.join(STATIC_DIR, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+
+def build_static():
+    """
+    Render the unfiltered home page and every player page to STATIC_DIR.
+
+    Run after each scrape (`flask --app dashboard build-static`); pages older
+    than their data file are ignored, so a missed build only costs speed.
+    Returns the number of player pages written.
+    """
+    with app.app_context():
+        write_page('index.html', render_home())
+
+        entry = load_cached_json('unified_american_players_*.json', unified_indexes)
+        count = 0
+        for code, player in (entry['by_code'] if entry else {}).items():
+            code = str(code or '')
+            if not code or '/' in code or code.startswith('.'):
+                continue
+            write_page(os.path.join('player', f'{code}.html'), render_player(player))
+            count += 1
+
+    return count
+
+
+@app.cli.command('build-static')
+def build_static_command():
+    """Pre-render the dashboard pages to output/html."""
+    count = build_static()
+    print(f"Wrote index.html and {count} player pages to {STATIC_DIR}")
+
+
+def static_page(relative_path, entry):
+    """
+    Serve a pre-rendered page if it exists and is newer than `entry`'s data
+    file; otherwise return None so the caller renders it.
+    """
+    path = safe_join(STATIC_DIR, relative_path)
+    if not entry or not path or not os.path.isfile(path):
+        return None
+    if os.stat(path).st_mtime < entry['mtime']:
+        return None
+    return send_from_directory(STATIC_DIR, relative_path, max_age=STATIC_MAX_AGE)
+
+
+# =============================================================================
+# ROUTES
+# =============================================================================
+
+@app.route('/')
+def home():
+    """Main page showing all players with filtering options."""
+    # The unfiltered list is the same for every visitor
+    if not request.args:
+        page = static_page('index.html', load_latest_entry())
+        if page:
+            return page
+
+    return render_home(
+        search=request.args.get('search', '').lower(),
+        selected_team=request.args.get('team', ''),
+        selected_state=request.args.get('state', ''),
+        sort_by=request.args.get('sort', 'name'),
+    )
+
+
 @app.route('/player/<code>')
 def player_detail(code):
     """Player detail page."""
+    entry = load_cached_json('unified_american_players_*.json', unified_indexes)
+    page = static_page(f'player/{code}.html', entry)
+    if page:
+        return page
+
     player = load_player_detail(code)
 
     if not player:
         return "Player not found", 404
 
-    return render_template_string(
-        BASE_TEMPLATE.replace('{% block content %}{% endblock %}',
-                              PLAYER_TEMPLATE.replace('{% extends "base" %}', '')),
-        player=player
-    )
+    return render_player(player)
 
 
 # =============================================================================
@@ -504,6 +647,8 @@ if __name__ == '__main__':
     print("=" * 60)
     print("\nStarting web server...")
     print("Open your browser to: http://localhost:5000")
-    print("\nPress Ctrl+C to stop the server\n")
+    print("\nPress Ctrl+C to stop the server")
+    print("(For production, use start.sh: gunicorn with threaded workers)\n")
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Local use only; the debug reloader is left off so the data cache stays warm
+    app.run(debug=False, host='0.0.0.0', port=5000, threaded=True)
@@ -18,6 +18,7 @@ import json
 import os
 import re
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 import logging
 import time
@@ -37,6 +38,12 @@ logger = logging.getLogger(__name__)
 WIKI_API = "https://en.wikipedia.org/w/api.php"
 HEADERS = {'User-Agent': 'LigaACBTracker/1.0 (basketball data collection)'}
 
+# Shared session: every lookup goes to the same Wikipedia host, so one
+# keep-alive connection is reused instead of a new TLS handshake per call
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
 # =============================================================================
 # MANUAL OVERRIDES
 # =============================================================================
@@ -105,7 +112,7 @@ def search_wikipedia(name):
     }
 
     try:
-        resp = requests.get(WIKI_API, params=params, headers=HEADERS, timeout=10)
+        resp = SESSION.get(WIKI_API, params=params, timeout=10)
         data = resp.json()
         results = data.get('query', {}).get('search', [])
 
@@ -136,7 +143,7 @@ def get_wiki_wikitext(title):
     }
 
     try:
-        resp = requests.get(WIKI_API, params=params, headers=HEADERS, timeout=15)
+        resp = SESSION.get(WIKI_API, params=params, timeout=15)
         data = resp.json()
         pages = data.get('query', {}).get('pages', {})
 
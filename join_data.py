@@ -18,9 +18,17 @@ OUTPUT:
     - american_players_summary_*.json: Lightweight version for dashboard list
 """
 
-import json
+import difflib
+import functools
+import mmap
+import operator
 import os
-from glob import glob
+import re
+import unicodedata
+import orjson
+from bisect import bisect_right
+from collections import defaultdict
+from fnmatch import fnmatchcase
 from datetime import datetime
 import logging
 
@@ -30,33 +38,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'output', 'json')
 
-def load_latest_json(pattern):
+
+def read_json(f):
+    """
+    Parse JSON from a file opened in binary mode.
+    The file is memory-mapped and handed to orjson without first being
+    copied into a bytes object.
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # Empty files can't be mapped; let orjson report them
+        return orjson.loads(f.read())
+    with mm, memoryview(mm) as view:
+        return orjson.loads(view)
+
+
+def list_output_files():
+    """File names in the output directory (listed once per run by main)."""
+    try:
+        return os.listdir(OUTPUT_DIR)
+    except FileNotFoundError:
+        return []
+
+
+def matching_files(pattern, output_files=None):
+    """Paths of output files matching a glob-style pattern (unordered)."""
+    if output_files is None:
+        output_files = list_output_files()
+    return [os.path.join(OUTPUT_DIR, f) for f in output_files if fnmatchcase(f, pattern)]
+
+
+def load_latest_json(pattern, output_files=None):
     """Load the most recent JSON file matching the pattern."""
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
-    files = sorted(glob(os.path.join(output_dir, pattern)))
+    files = matching_files(pattern, output_files)
 
     if not files:
         logger.warning(f"No files found matching: {pattern}")
         return None
 
-    filepath = files[-1]
+    # Timestamped names sort chronologically; only the newest is needed
+    filepath = max(files)
     logger.info(f"Loading: {os.path.basename(filepath)}")
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return read_json(f)
 
 
-def load_best_schedule():
+def load_best_schedule(output_files=None):
     """Load the schedule file with the most games. Prefers ACB.com data over TheSportsDB."""
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
 
     # First, try ACB schedule (more complete)
-    acb_schedule = os.path.join(output_dir, 'acb_schedule_latest.json')
+    acb_schedule = os.path.join(OUTPUT_DIR, 'acb_schedule_latest.json')
     if os.path.exists(acb_schedule):
         try:
-            with open(acb_schedule, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(acb_schedule, 'rb') as f:
+                data = read_json(f)
                 game_count = len(data.get('games', []))
                 logger.info(f"Loading ACB schedule: acb_schedule_latest.json ({game_count} games)")
                 return data
@@ -64,58 +102,65 @@ def load_best_schedule():
             logger.warning(f"Error reading ACB schedule: {e}")
 
     # Fallback to TheSportsDB schedule files
-    files = sorted(glob(os.path.join(output_dir, 'schedule_*.json')))
+    files = sorted(matching_files('schedule_*.json', output_files))  # Oldest first on ties
 
     if not files:
         logger.warning("No schedule files found")
         return None
 
-    # Find the file with the most games
+    # Find the file with the most games (keeping its parsed data, so the
+    # winner isn't read twice)
     best_file = None
+    best_data = None
     best_count = 0
 
     for filepath in files:
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = read_json(f)
                 game_count = len(data.get('games', []))
                 if game_count > best_count:
                     best_count = game_count
                     best_file = filepath
+                    best_data = data
         except Exception as e:
             logger.warning(f"Error reading {filepath}: {e}")
 
     if best_file:
         logger.info(f"Loading schedule: {os.path.basename(best_file)} ({best_count} games)")
-        with open(best_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
 
-    return None
+    return best_data
+
 
+def save_json(data, filename, indent=2):
+    """
+    Save data to a JSON file and return its path.
+    indent=2 pretty-prints (archive files); indent=None writes compact JSON.
+    """
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    filepath = os.path.join(OUTPUT_DIR, filename)
 
-def save_json(data, filename):
-    """Save data to a JSON file."""
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
-    os.makedirs(output_dir, exist_ok=True)
-    filepath = os.path.join(output_dir, filename)
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2  # orjson's only indent width
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, option=option, default=str))
 
     logger.info(f"Saved: {filepath}")
+    return filepath
 
 
 def load_boxscore_dates():
     """Load dates from ACB box scores for game_log enrichment."""
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
-    filepath = os.path.join(output_dir, 'acb_boxscores_latest.json')
+    filepath = os.path.join(OUTPUT_DIR, 'acb_boxscores_latest.json')
 
     if not os.path.exists(filepath):
         return {}
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = read_json(f)
             lookup = {}
             for box in data.get('box_scores', []):
                 match_id = box.get('match_id')
@@ -134,16 +179,15 @@ def load_boxscore_dates():
 
 def load_acb_stats():
     """Load ACB.com box score stats for American players."""
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
-    filepath = os.path.join(output_dir, 'acb_american_players_latest.json')
+    filepath = os.path.join(OUTPUT_DIR, 'acb_american_players_latest.json')
 
     if not os.path.exists(filepath):
         logger.warning("No ACB stats file found. Run acb_scraper.py first.")
         return {}
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = read_json(f)
             players = data.get('players', [])
             logger.info(f"Loaded ACB stats for {len(players)} players")
 
@@ -161,32 +205,150 @@ def load_acb_stats():
         return {}
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name):
-    """Normalize player name for matching."""
+    """Normalize player name for matching (cached: the same names recur across sources)."""
     if not name:
         return ''
-    import unicodedata
-    name = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('ASCII')
+    # Plain ASCII names have nothing to decompose or strip
+    if not name.isascii():
+        # Quick check first: already-decomposed names skip the full NFKD pass
+        if not unicodedata.is_normalized('NFKD', name):
+            name = unicodedata.normalize('NFKD', name)
+        name = name.encode('ASCII', 'ignore').decode('ASCII')
     return name.lower().strip()
 
 
-def match_acb_player(player_name, acb_lookup):
+def build_acb_matcher(acb_lookup):
+    """
+    Build the partial-name matcher for match_acb_player.
+
+    Returns a function taking a normalized name and returning the first ACB
+    player (in lookup order) whose name is inside it or contains it, or None.
+    Instead of scanning every ACB name per player, this is one regex pass for
+    ACB names inside the name and one substring search over the
+    newline-joined ACB names for the reverse direction.
+    """
+    acb_names = list(acb_lookup)
+    acb_players = list(acb_lookup.values())
+    if not acb_names:
+        return lambda name_norm: None
+
+    # Zero-width lookahead so every position is tried; at each position the
+    # alternation picks the earliest ACB name that starts there
+    contained_re = re.compile('(?=(' + '|'.join(re.escape(n) for n in acb_names) + '))')
+    position = {n: i for i, n in enumerate(acb_names)}
+
+    names_blob = '\n'.join(acb_names)
+    starts = []
+    offset = 0
+    for n in acb_names:
+        starts.append(offset)
+        offset += len(n) + 1
+
+    def matcher(name_norm):
+        best = None
+        for m in contained_re.finditer(name_norm):
+            i = position[m.group(1)]
+            if best is None or i < best:
+                best = i
+        if '\n' not in name_norm:
+            found = names_blob.find(name_norm)
+            if found != -1:
+                i = bisect_right(starts, found) - 1
+                if best is None or i < best:
+                    best = i
+        return acb_players[best] if best is not None else None
+
+    return matcher
+
+
+# Minimum difflib similarity ratio for the last-resort fuzzy name match
+# (only tried between same-last-name players on the same team)
+FUZZY_MATCH_CUTOFF = 0.85
+
+
+def build_acb_index(acb_lookup):
+    """
+    Index ACB players for match_acb_player.
+
+    Each ACB name is normalized once and keyed by full name. Names without a
+    full first name ("T. Kalinoski", "KALINOSKI") are also keyed by first
+    initial plus last name and by last name; where two players share a key
+    the first one wins. Names none of the keys catch fall back to the
+    partial-name matcher. Every ACB player is also listed under its exact
+    last name for fuzzy_match_acb_player.
+    """
+    index = {'full': {}, 'initial_last': {}, 'last': {}, 'by_last': defaultdict(list),
+             'matcher': build_acb_matcher(acb_lookup)}
+
+    for acb_data in acb_lookup.values():
+        parts = normalize_name(acb_data.get('name', '')).split()
+        if not parts:
+            continue
+        index['full'].setdefault(' '.join(parts), acb_data)
+        index['by_last'][parts[-1]].append((' '.join(parts), acb_data))
+        if len(parts) == 1 or parts[0].endswith('.'):
+            index['last'].setdefault(parts[-1], acb_data)
+            if len(parts) > 1:
+                index['initial_last'].setdefault(f"{parts[0][0]} {parts[-1]}", acb_data)
+
+    return index
+
+
+def match_acb_player(player_name, acb_index):
     """Find matching ACB player by name."""
     name_norm = normalize_name(player_name)
 
-    # Try exact match on last name
     parts = name_norm.split()
     if parts:
-        last_name = parts[-1]
-        if last_name in acb_lookup:
-            return acb_lookup[last_name]
-
-    # Try full name match
-    for acb_name, acb_data in acb_lookup.items():
-        if acb_name in name_norm or name_norm in acb_name:
+        # Full name, then initial + last name, then last name alone
+        acb_data = acb_index['full'].get(' '.join(parts))
+        if acb_data is None and len(parts) > 1:
+            acb_data = acb_index['initial_last'].get(f"{parts[0][0]} {parts[-1]}")
+        if acb_data is None:
+            acb_data = acb_index['last'].get(parts[-1])
+        if acb_data is not None:
             return acb_data
 
-    return None
+    # Partial name match
+    return acb_index['matcher'](name_norm)
+
+
+def acb_player_teams(acb_data, game_lookup):
+    """Teams that played in every game of an ACB player's game log (empty if unknown)."""
+    teams = None
+    for entry in acb_data.get('game_log', []):
+        game_info = game_lookup.get(entry.get('match_id'))
+        if not game_info:
+            continue
+        game_teams = {game_info.get('home_team'), game_info.get('away_team')} - {None}
+        teams = game_teams if teams is None else teams & game_teams
+    return teams or set()
+
+
+def fuzzy_match_acb_player(player_name, team_name, acb_index, claimed, game_lookup):
+    """
+    Last-resort match for a player the name lookups missed: a close spelling
+    (typos, transliteration differences) of an ACB player with exactly the
+    same last name, whose games were played by the roster player's team.
+
+    ACB players whose id() is in `claimed` (already matched to someone) are
+    skipped. Returns None rather than guessing when nothing qualifies.
+    """
+    parts = normalize_name(player_name).split()
+    if not parts or not team_name:
+        return None
+
+    full_name = ' '.join(parts)
+    best, best_ratio = None, FUZZY_MATCH_CUTOFF
+    for acb_name, acb_data in acb_index['by_last'].get(parts[-1], ()):
+        if id(acb_data) in claimed or team_name not in acb_player_teams(acb_data, game_lookup):
+            continue
+        ratio = difflib.SequenceMatcher(None, full_name, acb_name).ratio()
+        if ratio >= best_ratio:
+            best, best_ratio = acb_data, ratio
+    return best
 
 
 # Team name mapping from ACB format to TheSportsDB names
@@ -252,6 +414,16 @@ def normalize_acb_team_name(raw_name):
     return raw_name
 
 
+# Fields copied from each unified record into the dashboard summary file
+SUMMARY_FIELDS = (
+    'code', 'name', 'team', 'team_code', 'position', 'jersey',
+    'height_feet', 'height_inches', 'birth_date',
+    'hometown', 'hometown_state', 'college', 'high_school',
+    'headshot_url', 'games_played', 'ppg', 'rpg', 'apg',
+)
+SUMMARY_GETTER = operator.itemgetter(*SUMMARY_FIELDS)
+
+
 def main():
     """Main entry point."""
     logger.info("=" * 60)
@@ -263,10 +435,12 @@ def main():
     # =========================================================================
     # Load All Data Sources
     # =========================================================================
-    players_data = load_latest_json('american_players_2*.json')  # Excludes summary files
-    hometowns_data = load_latest_json('american_hometowns_found_*.json')
-    schedule_data = load_best_schedule()  # Uses file with most games (handles rate limit fallback)
+    output_files = list_output_files()  # One directory listing shared by the loaders
+    players_data = load_latest_json('american_players_2*.json', output_files)  # Excludes summary files
+    hometowns_data = load_latest_json('american_hometowns_found_*.json', output_files)
+    schedule_data = load_best_schedule(output_files)  # Uses file with most games (handles rate limit fallback)
     acb_stats = load_acb_stats()  # Box score stats from ACB.com
+    acb_index = build_acb_index(acb_stats)
     boxscore_dates = load_boxscore_dates()  # Dates from box scores (schedule may have null dates)
 
     if not players_data:
@@ -276,23 +450,37 @@ def main():
     players = players_data.get('players', [])
     logger.info(f"Loaded {len(players)} American players")
 
-    # Build hometown lookup dictionary
+    # Build hometown lookup dictionary, plus the "City, State" display string
+    # for each code (formatted once here rather than per unified record)
     hometown_lookup = {}
+    hometown_display = {}
     if hometowns_data:
         for p in hometowns_data.get('players', []):
             code = p.get('code')
             if code:
                 hometown_lookup[code] = p
+                city = p.get('hometown_city')
+                state = p.get('hometown_state')
+                hometown_display[code] = f"{city}, {state}" if city and state else None
         logger.info(f"Loaded {len(hometown_lookup)} hometown records")
 
     # Build all games by team (both past and upcoming)
-    past_by_team = {}
-    upcoming_by_team = {}
+    past_by_team = defaultdict(list)
+    upcoming_by_team = defaultdict(list)
     if schedule_data:
         # Check if this is ACB schedule (needs team name normalization)
         is_acb_schedule = schedule_data.get('source') == 'acb.com'
 
-        for game in schedule_data.get('games', []):
+        # Sort the schedule by date once (handle None dates) so every team's
+        # list below is built already in order: past games most recent first,
+        # upcoming games soonest first
+        games = schedule_data.get('games', [])
+        games_by_date = (
+            sorted((g for g in games if g.get('played', False)), key=lambda g: g.get('date') or '', reverse=True)
+            + sorted((g for g in games if not g.get('played', False)), key=lambda g: g.get('date') or '')
+        )
+
+        for game in games_by_date:
             home_team_raw = game.get('home_team')
             away_team_raw = game.get('away_team')
 
@@ -305,53 +493,61 @@ def main():
                 away_team = away_team_raw
 
             played = game.get('played', False)
-
-            game_info = {
-                'date': game.get('date'),
-                'round': game.get('round'),
-                'venue': game.get('venue'),
-                'home_team': home_team,
-                'away_team': away_team,
-                'home_score': game.get('home_score'),
-                'away_score': game.get('away_score'),
-                'played': played,
-            }
+            date = game.get('date')
+            game_round = game.get('round')
+            venue = game.get('venue')
+            home_score = game.get('home_score')
+            away_score = game.get('away_score')
+
+            # W/L from the scores read above; a played game missing a score
+            # gets no result rather than failing on a None comparison
+            if played and home_score is not None and away_score is not None:
+                home_result = 'W' if home_score > away_score else 'L'
+                away_result = 'W' if away_score > home_score else 'L'
+            else:
+                home_result = away_result = None
 
             # Determine which dict to use based on played status
             target_dict = past_by_team if played else upcoming_by_team
 
+            # Each team's record is built directly (no shared dict copied twice)
+
             # Add to home team's schedule
             if home_team:
-                if home_team not in target_dict:
-                    target_dict[home_team] = []
                 target_dict[home_team].append({
-                    **game_info,
+                    'date': date,
+                    'round': game_round,
+                    'venue': venue,
+                    'home_team': home_team,
+                    'away_team': away_team,
+                    'home_score': home_score,
+                    'away_score': away_score,
+                    'played': played,
                     'opponent': away_team,
                     'home_away': 'Home',
-                    'team_score': game.get('home_score'),
-                    'opponent_score': game.get('away_score'),
-                    'result': 'W' if played and game.get('home_score', 0) > game.get('away_score', 0) else ('L' if played else None),
+                    'team_score': home_score,
+                    'opponent_score': away_score,
+                    'result': home_result,
                 })
 
             # Add to away team's schedule
             if away_team:
-                if away_team not in target_dict:
-                    target_dict[away_team] = []
                 target_dict[away_team].append({
-                    **game_info,
+                    'date': date,
+                    'round': game_round,
+                    'venue': venue,
+                    'home_team': home_team,
+                    'away_team': away_team,
+                    'home_score': home_score,
+                    'away_score': away_score,
+                    'played': played,
                     'opponent': home_team,
                     'home_away': 'Away',
-                    'team_score': game.get('away_score'),
-                    'opponent_score': game.get('home_score'),
-                    'result': 'W' if played and game.get('away_score', 0) > game.get('home_score', 0) else ('L' if played else None),
+                    'team_score': away_score,
+                    'opponent_score': home_score,
+                    'result': away_result,
                 })
 
-        # Sort each team's games by date (handle None dates)
-        for team in past_by_team:
-            past_by_team[team].sort(key=lambda x: x.get('date') or '', reverse=True)  # Most recent first
-        for team in upcoming_by_team:
-            upcoming_by_team[team].sort(key=lambda x: x.get('date') or '')
-
         logger.info(f"Built past games for {len(past_by_team)} teams")
         logger.info(f"Built upcoming games for {len(upcoming_by_team)} teams")
 
@@ -380,12 +576,27 @@ def main():
                 }
         logger.info(f"Built game lookup with {len(game_lookup)} games")
 
+    # =========================================================================
+    # Match Players to ACB Box Score Stats
+    # =========================================================================
+    # Name lookups first for everyone, so the fuzzy pass can't hand out an
+    # ACB record that belongs to a player matched exactly
+    acb_matches = [match_acb_player(player.get('name', ''), acb_index) for player in players]
+    claimed = {id(acb_data) for acb_data in acb_matches if acb_data is not None}
+    for i, player in enumerate(players):
+        if acb_matches[i] is None:
+            acb_data = fuzzy_match_acb_player(player.get('name', ''), player.get('team_name'),
+                                              acb_index, claimed, game_lookup)
+            if acb_data is not None:
+                claimed.add(id(acb_data))
+                acb_matches[i] = acb_data
+
     # =========================================================================
     # Build Unified Player Records
     # =========================================================================
     unified_players = []
 
-    for player in players:
+    for player, acb_player in zip(players, acb_matches):
         code = player.get('code')
         player_name = player.get('name', '')
 
@@ -397,8 +608,7 @@ def main():
         past_games = past_by_team.get(team_name, [])  # All past games
         upcoming_games = upcoming_by_team.get(team_name, [])  # All upcoming games
 
-        # Get ACB box score stats if available
-        acb_player = match_acb_player(player_name, acb_stats)
+        # ACB box score stats (matched above), if available
         game_log = []
         games_played = 0
         ppg = 0.0
@@ -411,7 +621,8 @@ def main():
             ppg = acb_player.get('calculated_ppg', 0.0)
             rpg = acb_player.get('calculated_rpg', 0.0)
             apg = acb_player.get('calculated_apg', 0.0)
-            logger.debug(f"  Matched ACB stats for {player_name}: {games_played} games, {ppg} PPG")
+            # Lazy %-formatting: skipped entirely unless DEBUG is enabled
+            logger.debug("  Matched ACB stats for %s: %s games, %s PPG", player_name, games_played, ppg)
 
             # Enrich game_log with opponent info from schedule
             for entry in raw_game_log:
@@ -466,7 +677,7 @@ def main():
             # Hometown data from Wikipedia
             'hometown_city': hometown.get('hometown_city'),
             'hometown_state': hometown.get('hometown_state'),
-            'hometown': f"{hometown.get('hometown_city')}, {hometown.get('hometown_state')}" if hometown.get('hometown_city') and hometown.get('hometown_state') else None,
+            'hometown': hometown_display.get(code),
             'college': hometown.get('college'),
             'high_school': hometown.get('high_school'),
 
@@ -511,34 +722,14 @@ def main():
         'players': unified_players
     }
 
+    # Timestamped archive stays readable; the dashboard's _latest copy is compact
     save_json(unified_data, f'unified_american_players_{timestamp}.json')
-    save_json(unified_data, 'unified_american_players_latest.json')  # For dashboard
+    save_json(unified_data, 'unified_american_players_latest.json', indent=None)  # For dashboard
 
     # =========================================================================
     # Save Summary Version (lighter weight for dashboard list)
     # =========================================================================
-    summary_players = []
-    for p in unified_players:
-        summary_players.append({
-            'code': p['code'],
-            'name': p['name'],
-            'team': p['team'],
-            'team_code': p['team_code'],
-            'position': p['position'],
-            'jersey': p['jersey'],
-            'height_feet': p['height_feet'],
-            'height_inches': p['height_inches'],
-            'birth_date': p['birth_date'],
-            'hometown': p['hometown'],
-            'hometown_state': p['hometown_state'],
-            'college': p['college'],
-            'high_school': p['high_school'],
-            'headshot_url': p['headshot_url'],
-            'games_played': p['games_played'],
-            'ppg': p['ppg'],
-            'rpg': p['rpg'],
-            'apg': p['apg'],
-        })
+    summary_players = [dict(zip(SUMMARY_FIELDS, SUMMARY_GETTER(p))) for p in unified_players]
 
     summary_data = {
         'export_date': datetime.now().isoformat(),
@@ -549,7 +740,7 @@ def main():
     }
 
     save_json(summary_data, f'american_players_summary_{timestamp}.json')
-    save_json(summary_data, 'american_players_summary_latest.json')  # For dashboard
+    save_json(summary_data, 'american_players_summary_latest.json', indent=None)  # For dashboard
 
     # =========================================================================
     # Summary
@@ -559,8 +750,10 @@ def main():
     logger.info("=" * 60)
     logger.info(f"Total players: {len(unified_players)}")
 
-    with_hometown = sum(1 for p in unified_players if p.get('hometown'))
-    with_college = sum(1 for p in unified_players if p.get('college'))
+    with_hometown = with_college = 0
+    for p in unified_players:
+        with_hometown += bool(p['hometown'])
+        with_college += bool(p['college'])
 
     logger.info(f"With hometown: {with_hometown}")
     logger.info(f"With college: {with_college}")
@@ -568,8 +761,7 @@ def main():
     if unified_players:
         logger.info("\nPlayers:")
         for p in unified_players[:15]:
-            ht = f"{p['hometown']}" if p.get('hometown') else "Unknown"
-            logger.info(f"  {p['name']} - {p['team']} | {ht}")
+            logger.info("  %s - %s | %s", p['name'], p['team'], p.get('hometown') or "Unknown")
 
 
 if __name__ == '__main__':
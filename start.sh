@@ -2,5 +2,10 @@
 # Startup script: Start web server immediately using pre-built data
 # Data is populated during Docker build phase for fast cold starts
 
+echo "=== Pre-rendering dashboard pages ==="
+flask --app dashboard build-static || echo "Static build failed; pages will be rendered per request"
+
 echo "=== Starting web server ==="
-exec gunicorn dashboard:app --bind 0.0.0.0:5000
+# Threaded workers: requests are served from the in-memory data cache, so
+# each worker process can handle several concurrent requests
+exec gunicorn dashboard:app --bind 0.0.0.0:5000 --workers 2 --worker-class gthread --threads 8
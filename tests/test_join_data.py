@@ -0,0 +1,53 @@
+"""Tests for ACB player name matching in join_data.py."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from join_data import build_acb_index, fuzzy_match_acb_player, match_acb_player
+
+GAME_LOOKUP = {
+    '1': {'home_team': 'Baskonia', 'away_team': 'Valencia Basket'},
+    '2': {'home_team': 'Real Madrid Baloncesto', 'away_team': 'Baskonia'},
+}
+
+
+def acb_player(name, *match_ids):
+    return {'name': name, 'game_log': [{'match_id': m} for m in match_ids]}
+
+
+class FuzzyMatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.justin = acb_player('Justin Johnson', '1', '2')  # Baskonia
+        self.kevin = acb_player('Kevin Allan', '1')           # Baskonia or Valencia
+        self.index = build_acb_index({'justin johnson': self.justin, 'kevin allan': self.kevin})
+
+    def fuzzy(self, name, team, claimed=()):
+        return fuzzy_match_acb_player(name, team, self.index, set(claimed), GAME_LOOKUP)
+
+    def test_similar_first_name_on_other_team_does_not_match(self):
+        self.assertIsNone(match_acb_player('Dustin Johnson', self.index))
+        self.assertIsNone(self.fuzzy('Dustin Johnson', 'Real Madrid Baloncesto'))
+        self.assertIsNone(self.fuzzy('Austin Johnson', 'CB Murcia'))
+
+    def test_different_last_name_does_not_match(self):
+        self.assertIsNone(self.fuzzy('Kevin Allen', 'Baskonia'))
+
+    def test_unknown_team_does_not_match(self):
+        self.assertIsNone(self.fuzzy('Dustin Johnson', None))
+
+    def test_claimed_record_is_not_reused(self):
+        self.assertIsNone(self.fuzzy('Dustin Johnson', 'Baskonia', claimed=[id(self.justin)]))
+
+    def test_misspelled_last_name_does_not_match(self):
+        self.assertIsNone(self.fuzzy('Justin Jonhson', 'Baskonia'))
+
+    def test_close_first_name_on_same_team_matches(self):
+        self.assertIs(self.fuzzy('Justine Johnson', 'Baskonia'), self.justin)
+
+
+if __name__ == '__main__':
+    unittest.main()